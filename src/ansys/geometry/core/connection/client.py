@@ -27,6 +27,10 @@ import time
 
 from ansys.api.dbu.v0.admin_pb2 import BackendType as GRPCBackendType
 from ansys.api.dbu.v0.admin_pb2_grpc import AdminStub
+from ansys.api.geometry.v0.bodies_pb2_grpc import BodiesStub
+from ansys.api.geometry.v0.commands_pb2_grpc import CommandsStub
+from ansys.api.geometry.v0.edges_pb2_grpc import EdgesStub
+from ansys.api.geometry.v0.faces_pb2_grpc import FacesStub
 from beartype import beartype as check_input_types
 from beartype.typing import Optional, Union
 from google.protobuf.empty_pb2 import Empty
@@ -169,6 +173,12 @@ class GrpcClient:
 
         self._admin_stub = AdminStub(self._channel)
 
+        # Stubs shared by all the (potentially numerous) objects of the design
+        self._bodies_stub = BodiesStub(self._channel)
+        self._commands_stub = CommandsStub(self._channel)
+        self._edges_stub = EdgesStub(self._channel)
+        self._faces_stub = FacesStub(self._channel)
+
         # retrieve the backend information
         grpc_backend_response = self._admin_stub.GetBackend(Empty())
 
@@ -243,6 +253,26 @@ class GrpcClient:
         """Client gRPC channel."""
         return self._channel
 
+    @property
+    def bodies_stub(self) -> BodiesStub:
+        """Bodies stub shared by all objects using this client."""
+        return self._bodies_stub
+
+    @property
+    def commands_stub(self) -> CommandsStub:
+        """Commands stub shared by all objects using this client."""
+        return self._commands_stub
+
+    @property
+    def edges_stub(self) -> EdgesStub:
+        """Edges stub shared by all objects using this client."""
+        return self._edges_stub
+
+    @property
+    def faces_stub(self) -> FacesStub:
+        """Faces stub shared by all objects using this client."""
+        return self._faces_stub
+
     @property
     def log(self) -> PyGeometryCustomAdapter:
         """Specific instance logger."""
@@ -389,7 +389,10 @@ def tess_to_pd(tess: Tessellation) -> "PolyData":
     import numpy as np
     import pyvista as pv
 
-    return pv.PolyData(np.array(tess.vertices).reshape(-1, 3), tess.faces)
+    # Sizing the arrays upfront avoids growing them while iterating the repeated fields
+    vertices = np.fromiter(tess.vertices, dtype=np.float64, count=len(tess.vertices))
+    faces = np.fromiter(tess.faces, dtype=np.int64, count=len(tess.faces))
+    return pv.PolyData(vertices.reshape(-1, 3), faces)
 
 
 def grpc_matrix_to_matrix(m: GRPCMatrix) -> Matrix44:
@@ -22,7 +22,6 @@
 """Provides for managing a body."""
 from abc import ABC, abstractmethod
 from enum import Enum, unique
-from functools import wraps
 
 from ansys.api.dbu.v0.dbumodels_pb2 import EntityIdentifier
 from ansys.api.geometry.v0.bodies_pb2 import (
@@ -36,16 +35,14 @@ from ansys.api.geometry.v0.bodies_pb2 import (
     SetAssignedMaterialRequest,
     TranslateRequest,
 )
-from ansys.api.geometry.v0.bodies_pb2_grpc import BodiesStub
 from ansys.api.geometry.v0.commands_pb2 import (
     AssignMidSurfaceOffsetTypeRequest,
     AssignMidSurfaceThicknessRequest,
     ImprintCurvesRequest,
     ProjectCurvesRequest,
 )
-from ansys.api.geometry.v0.commands_pb2_grpc import CommandsStub
-from beartype import beartype as check_input_types
 from beartype.typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
+import numpy as np
 from pint import Quantity
 
 from ansys.geometry.core.connection.client import GrpcClient
@@ -67,7 +64,13 @@ from ansys.geometry.core.math.matrix import Matrix44
 from ansys.geometry.core.math.plane import Plane
 from ansys.geometry.core.math.point import Point3D
 from ansys.geometry.core.math.vector import UnitVector3D
-from ansys.geometry.core.misc.checks import check_type, ensure_design_is_active, min_backend_version
+from ansys.geometry.core.misc.checks import (
+    DEBUG_CHECKS,
+    check_input_types_on_debug,
+    check_type,
+    ensure_design_is_active,
+    min_backend_version,
+)
 from ansys.geometry.core.misc.measurements import DEFAULT_UNITS, Angle, Distance
 from ansys.geometry.core.sketch.sketch import Sketch
 from ansys.geometry.core.typing import Real
@@ -100,6 +103,58 @@ class CollisionType(Enum):
     CONTAINEDTOUCH = 4
 
 
+# Lookup tables used instead of resolving enum members on each call
+_MID_SURFACE_OFFSET_VALUES = {offset: offset.value for offset in MidSurfaceOffsetType}
+_SURFACE_TYPES = {surface_type.value: surface_type for surface_type in SurfaceType}
+_CURVE_TYPES = {curve_type.value: curve_type for curve_type in CurveType}
+
+# Volume of all surface bodies
+_ZERO_VOLUME = Quantity(0, DEFAULT_UNITS.SERVER_VOLUME)
+
+# Scale factors from each length unit to the (non-modifiable) server length unit
+_SERVER_LENGTH_SCALES = {}
+
+
+def _to_server_length(quantity: Quantity) -> Real:
+    """Get the magnitude of a length quantity in the server length unit."""
+    units = quantity.units
+    scale = _SERVER_LENGTH_SCALES.get(units)
+    if scale is None:
+        scale = Quantity(1, units).m_as(DEFAULT_UNITS.SERVER_LENGTH)
+        _SERVER_LENGTH_SCALES[units] = scale
+    return quantity.m * scale
+
+
+def _build_faces(grpc_faces, body: "IBody", grpc_client: GrpcClient) -> List[Face]:
+    """Build the ``Face`` objects of a body from the faces returned by the server."""
+    surface_types = _SURFACE_TYPES
+    return [
+        Face(
+            grpc_face.id,
+            surface_types[grpc_face.surface_type],
+            body,
+            grpc_client,
+            grpc_face.is_reversed,
+        )
+        for grpc_face in grpc_faces
+    ]
+
+
+def _build_edges(grpc_edges, body: "IBody", grpc_client: GrpcClient) -> List[Edge]:
+    """Build the ``Edge`` objects of a body from the edges returned by the server."""
+    curve_types = _CURVE_TYPES
+    return [
+        Edge(
+            grpc_edge.id,
+            curve_types[grpc_edge.curve_type],
+            body,
+            grpc_client,
+            grpc_edge.is_reversed,
+        )
+        for grpc_edge in grpc_edges
+    ]
+
+
 class IBody(ABC):
     """
     Defines the common methods for a body, providing the abstract body interface.
@@ -108,6 +163,8 @@ class IBody(ABC):
     class. All child classes must implement all abstract methods.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def id(self) -> str:
         """Get the ID of the body as a string."""
@@ -470,6 +527,11 @@ class IBody(ABC):
         ~pyvista.PolyData, ~pyvista.MultiBlock
             Merged :class:`pyvista.PolyData` if ``merge=True`` or a composite dataset.
 
+        Notes
+        -----
+        The tessellation is cached until the body is modified. Each call returns
+        a deep copy of the cached dataset, so it can be modified in place.
+
         Examples
         --------
         Extrude a box centered at the origin to create a rectangular body and
@@ -655,10 +717,11 @@ class MasterBody(IBody):
         is_surface: bool = False,
     ):
         """Initialize the ``MasterBody`` class."""
-        check_type(id, str)
-        check_type(name, str)
-        check_type(grpc_client, GrpcClient)
-        check_type(is_surface, bool)
+        if DEBUG_CHECKS:
+            check_type(id, str)
+            check_type(name, str)
+            check_type(grpc_client, GrpcClient)
+            check_type(is_surface, bool)
 
         self._id = id
         self._name = name
@@ -667,13 +730,38 @@ class MasterBody(IBody):
         self._surface_thickness = None
         self._surface_offset = None
         self._is_alive = True
-        self._bodies_stub = BodiesStub(self._grpc_client.channel)
-        self._commands_stub = CommandsStub(self._grpc_client.channel)
+        self._bodies_stub = self._grpc_client.bodies_stub
+        self._commands_stub = self._grpc_client.commands_stub
+        self._tessellation = None
+        self._tessellation_future = None
+        self._tessellation_datasets = {}
+        self._faces_cache = {}
+        self._edges_cache = {}
+        self._volume = None
+        self._last_translate_request = None
+
+    def _reset_caches(self) -> None:
+        """
+        Reset the cached tessellation, faces, edges, and volume of the body.
+
+        Notes
+        -----
+        The faces and edges caches are keyed by the ID of the requesting body. Thus,
+        resetting the caches of the master body resets them for all of its occurrences.
+        """
         self._tessellation = None
+        self._tessellation_future = None
+        self._tessellation_datasets.clear()
+        self._faces_cache.clear()
+        self._edges_cache.clear()
+        self._volume = None
 
-    def reset_tessellation_cache(func):
+    def protect_grpc_reset_caches(func):
         """
-        Decorate ``MasterBody`` methods that require a tessellation cache update.
+        Decorate ``MasterBody`` methods that call the server and require a cache update.
+
+        The gRPC protection, the debug input type checks, and the cache reset share
+        a single wrapper.
 
         Parameters
         ----------
@@ -685,13 +773,9 @@ class MasterBody(IBody):
         Any
             Output of the method, if any.
         """
-
-        @wraps(func)
-        def wrapper(self: "MasterBody", *args, **kwargs):
-            self._tessellation = None
-            return func(self, *args, **kwargs)
-
-        return wrapper
+        return protect_grpc(
+            check_input_types_on_debug(func), on_exit=lambda self: self._reset_caches()
+        )
 
     @property
     def _grpc_id(self) -> EntityIdentifier:  # noqa: D102
@@ -712,43 +796,33 @@ class MasterBody(IBody):
 
     @property
     def surface_thickness(self) -> Union[Quantity, None]:  # noqa: D102
-        return self._surface_thickness if self.is_surface else None
+        return self._surface_thickness if self._is_surface else None
 
     @property
     def surface_offset(self) -> Union["MidSurfaceOffsetType", None]:  # noqa: D102
-        return self._surface_offset if self.is_surface else None
+        return self._surface_offset if self._is_surface else None
 
     @property
     @protect_grpc
     def faces(self) -> List[Face]:  # noqa: D102
-        self._grpc_client.log.debug(f"Retrieving faces for body {self.id} from server.")
-        grpc_faces = self._bodies_stub.GetFaces(self._grpc_id)
-        return [
-            Face(
-                grpc_face.id,
-                SurfaceType(grpc_face.surface_type),
-                self,
-                self._grpc_client,
-                grpc_face.is_reversed,
-            )
-            for grpc_face in grpc_faces.faces
-        ]
+        grpc_faces = self._faces_cache.get(self.id)
+        if grpc_faces is None:
+            self._grpc_client.log.debug(f"Retrieving faces for body {self.id} from server.")
+            grpc_faces = self._bodies_stub.GetFaces(self._grpc_id).faces
+            self._faces_cache[self.id] = grpc_faces
+
+        return _build_faces(grpc_faces, self, self._grpc_client)
 
     @property
     @protect_grpc
     def edges(self) -> List[Edge]:  # noqa: D102
-        self._grpc_client.log.debug(f"Retrieving edges for body {self.id} from server.")
-        grpc_edges = self._bodies_stub.GetEdges(self._grpc_id)
-        return [
-            Edge(
-                grpc_edge.id,
-                CurveType(grpc_edge.curve_type),
-                self,
-                self._grpc_client,
-                grpc_edge.is_reversed,
-            )
-            for grpc_edge in grpc_edges.edges
-        ]
+        grpc_edges = self._edges_cache.get(self.id)
+        if grpc_edges is None:
+            self._grpc_client.log.debug(f"Retrieving edges for body {self.id} from server.")
+            grpc_edges = self._bodies_stub.GetEdges(self._grpc_id).edges
+            self._edges_cache[self.id] = grpc_edges
+
+        return _build_edges(grpc_edges, self, self._grpc_client)
 
     @property
     def is_alive(self) -> bool:  # noqa: D102
@@ -757,16 +831,18 @@ class MasterBody(IBody):
     @property
     @protect_grpc
     def volume(self) -> Quantity:  # noqa: D102
-        if self.is_surface:
+        if self._is_surface:
             self._grpc_client.log.debug("Dealing with planar surface. Returning 0 as the volume.")
-            return Quantity(0, DEFAULT_UNITS.SERVER_VOLUME)
-        else:
+            return _ZERO_VOLUME
+        elif self._volume is None:
             self._grpc_client.log.debug(f"Retrieving volume for body {self.id} from server.")
             volume_response = self._bodies_stub.GetVolume(self._grpc_id)
-            return Quantity(volume_response.volume, DEFAULT_UNITS.SERVER_VOLUME)
+            self._volume = Quantity(volume_response.volume, DEFAULT_UNITS.SERVER_VOLUME)
+
+        return self._volume
 
     @protect_grpc
-    @check_input_types
+    @check_input_types_on_debug
     def assign_material(self, material: Material) -> None:  # noqa: D102
         self._grpc_client.log.debug(f"Assigning body {self.id} material {material.name}.")
         self._bodies_stub.SetAssignedMaterial(
@@ -774,12 +850,12 @@ class MasterBody(IBody):
         )
 
     @protect_grpc
-    @check_input_types
+    @check_input_types_on_debug
     def add_midsurface_thickness(self, thickness: Quantity) -> None:  # noqa: D102
         if self.is_surface:
             self._commands_stub.AssignMidSurfaceThickness(
                 AssignMidSurfaceThicknessRequest(
-                    bodies_or_faces=[self.id], thickness=thickness.m_as(DEFAULT_UNITS.SERVER_LENGTH)
+                    bodies_or_faces=[self.id], thickness=_to_server_length(thickness)
                 )
             )
             self._surface_thickness = thickness
@@ -789,12 +865,12 @@ class MasterBody(IBody):
             )
 
     @protect_grpc
-    @check_input_types
+    @check_input_types_on_debug
     def add_midsurface_offset(self, offset: MidSurfaceOffsetType) -> None:  # noqa: D102
         if self.is_surface:
             self._commands_stub.AssignMidSurfaceOffsetType(
                 AssignMidSurfaceOffsetTypeRequest(
-                    bodies_or_faces=[self.id], offset_type=offset.value
+                    bodies_or_faces=[self.id], offset_type=_MID_SURFACE_OFFSET_VALUES[offset]
                 )
             )
             self._surface_offset = offset
@@ -804,7 +880,7 @@ class MasterBody(IBody):
             )
 
     @protect_grpc
-    @check_input_types
+    @check_input_types_on_debug
     def imprint_curves(
         self, faces: List[Face], sketch: Sketch
     ) -> Tuple[List[Edge], List[Face]]:  # noqa: D102
@@ -816,7 +892,7 @@ class MasterBody(IBody):
         )
 
     @protect_grpc
-    @check_input_types
+    @check_input_types_on_debug
     def project_curves(
         self,
         direction: UnitVector3D,
@@ -831,7 +907,7 @@ class MasterBody(IBody):
             """
         )
 
-    @check_input_types
+    @check_input_types_on_debug
     @protect_grpc
     def imprint_projected_curves(
         self,
@@ -847,29 +923,31 @@ class MasterBody(IBody):
             """
         )
 
-    @protect_grpc
-    @check_input_types
-    @reset_tessellation_cache
+    @protect_grpc_reset_caches
     def translate(
         self, direction: UnitVector3D, distance: Union[Quantity, Distance, Real]
     ) -> None:  # noqa: D102
-        distance = distance if isinstance(distance, Distance) else Distance(distance)
-
-        translation_magnitude = distance.value.m_as(DEFAULT_UNITS.SERVER_LENGTH)
+        if isinstance(distance, Quantity):
+            translation_magnitude = _to_server_length(distance)
+        else:
+            distance = distance if isinstance(distance, Distance) else Distance(distance)
+            translation_magnitude = _to_server_length(distance.value)
 
         self._grpc_client.log.debug(f"Translating body {self.id}.")
 
-        self._bodies_stub.Translate(
-            TranslateRequest(
+        # Repeated translations (i.e. animations) reuse the previous request
+        key = (direction.tobytes(), translation_magnitude)
+        if self._last_translate_request is None or self._last_translate_request[0] != key:
+            request = TranslateRequest(
                 ids=[self.id],
                 direction=unit_vector_to_grpc_direction(direction),
                 distance=translation_magnitude,
             )
-        )
+            self._last_translate_request = (key, request)
 
-    @protect_grpc
-    @check_input_types
-    @reset_tessellation_cache
+        self._bodies_stub.Translate(self._last_translate_request[1])
+
+    @protect_grpc_reset_caches
     @min_backend_version(24, 2, 0)
     def rotate(
         self,
@@ -889,25 +967,19 @@ class MasterBody(IBody):
             )
         )
 
-    @protect_grpc
-    @check_input_types
-    @reset_tessellation_cache
+    @protect_grpc_reset_caches
     @min_backend_version(24, 2, 0)
     def scale(self, value: Real) -> None:  # noqa: D102
         self._grpc_client.log.debug(f"Scaling body {self.id}.")
         self._bodies_stub.Scale(ScaleRequest(id=self.id, scale=value))
 
-    @protect_grpc
-    @check_input_types
-    @reset_tessellation_cache
+    @protect_grpc_reset_caches
     @min_backend_version(24, 2, 0)
     def map(self, frame: Frame) -> None:  # noqa: D102
         self._grpc_client.log.debug(f"Mapping body {self.id}.")
         self._bodies_stub.Map(MapRequest(id=self.id, frame=frame_to_grpc_frame(frame)))
 
-    @protect_grpc
-    @check_input_types
-    @reset_tessellation_cache
+    @protect_grpc_reset_caches
     @min_backend_version(24, 2, 0)
     def mirror(self, plane: Plane) -> None:  # noqa: D102
         self._grpc_client.log.debug(f"Mirroring body {self.id}.")
@@ -953,6 +1025,19 @@ class MasterBody(IBody):
         body_id = f"{parent.id}/{tb.id}" if parent.parent_component else tb.id
         return Body(body_id, response.name, parent, tb)
 
+    def _request_tessellation(self) -> None:
+        """
+        Request the tessellation of the body without waiting for the response.
+
+        Notes
+        -----
+        The response is consumed by the next call to the ``tessellate()`` method.
+        This allows callers to overlap the requests of several bodies.
+        """
+        if self.is_alive and self._tessellation is None and self._tessellation_future is None:
+            self._grpc_client.log.debug(f"Requesting tessellation for body {self.id}.")
+            self._tessellation_future = self._bodies_stub.GetTessellation.future(self._grpc_id)
+
     @protect_grpc
     def tessellate(
         self, merge: Optional[bool] = False, transform: Matrix44 = IDENTITY_MATRIX44
@@ -963,19 +1048,42 @@ class MasterBody(IBody):
         if not self.is_alive:
             return pv.PolyData() if merge else pv.MultiBlock()
 
-        self._grpc_client.log.debug(f"Requesting tessellation for body {self.id}.")
+        # Reuse the datasets already built for the same transformation
+        key = (transform.tobytes(), merge)
+        dataset = self._tessellation_datasets.get(key)
+        if dataset is not None:
+            return dataset.copy(deep=True)
 
         # cache tessellation
-        if not self._tessellation:
-            resp = self._bodies_stub.GetTessellation(self._grpc_id)
-            self._tessellation = resp.face_tessellation.values()
+        if self._tessellation is None:
+            if self._tessellation_future is None:
+                self._grpc_client.log.debug(f"Requesting tessellation for body {self.id}.")
+                resp = self._bodies_stub.GetTessellation(self._grpc_id)
+            else:
+                # Drop the future first, so that a failed request is not kept around
+                future, self._tessellation_future = self._tessellation_future, None
+                resp = future.result()
+            self._tessellation = list(resp.face_tessellation.values())
 
-        pdata = [tess_to_pd(tess).transform(transform) for tess in self._tessellation]
-        comp = pv.MultiBlock(pdata)
+        # Bodies placed at the root of the design are not transformed at all
+        needs_transform = not np.array_equal(transform, IDENTITY_MATRIX44)
+
+        pdata = [tess_to_pd(tess) for tess in self._tessellation]
         if merge:
-            ugrid = comp.combine()
-            return pv.PolyData(ugrid.points, ugrid.cells, n_faces=ugrid.n_cells)
-        return comp
+            ugrid = pv.MultiBlock(pdata).combine()
+            mesh = pv.PolyData(ugrid.points, ugrid.cells, n_faces=ugrid.n_cells)
+            # Transform the merged mesh once instead of each of its faces
+            if needs_transform:
+                mesh.transform(transform, inplace=True)
+            dataset = mesh
+        else:
+            if needs_transform:
+                for face_pdata in pdata:
+                    face_pdata.transform(transform, inplace=True)
+            dataset = pv.MultiBlock(pdata)
+
+        self._tessellation_datasets[key] = dataset
+        return dataset.copy(deep=True)
 
     def plot(
         self,
@@ -1035,6 +1143,8 @@ class Body(IBody):
         Master body that this body is an occurrence of.
     """
 
+    __slots__ = ("_id", "_name", "_parent_component", "_template")
+
     def __init__(self, id, name, parent_component: "Component", template: MasterBody) -> None:
         """Initialize the ``Body`` class."""
         self._id = id
@@ -1042,9 +1152,11 @@ class Body(IBody):
         self._parent_component = parent_component
         self._template = template
 
-    def reset_tessellation_cache(func):
+    def protect_grpc_reset_caches(func):
         """
-        Decorate ``Body`` methods that require a tessellation cache update.
+        Decorate ``Body`` methods that call the server and require a cache update.
+
+        The gRPC protection and the cache reset share a single wrapper.
 
         Parameters
         ----------
@@ -1056,13 +1168,7 @@ class Body(IBody):
         Any
             Output of the method, if any.
         """
-
-        @wraps(func)
-        def wrapper(self: "Body", *args, **kwargs):
-            self._template._tessellation = None
-            return func(self, *args, **kwargs)
-
-        return wrapper
+        return protect_grpc(func, on_exit=lambda self: self._template._reset_caches())
 
     @property
     def id(self) -> str:  # noqa: D102
@@ -1080,35 +1186,29 @@ class Body(IBody):
     @protect_grpc
     @ensure_design_is_active
     def faces(self) -> List[Face]:  # noqa: D102
-        self._template._grpc_client.log.debug(f"Retrieving faces for body {self.id} from server.")
-        grpc_faces = self._template._bodies_stub.GetFaces(EntityIdentifier(id=self.id))
-        return [
-            Face(
-                grpc_face.id,
-                SurfaceType(grpc_face.surface_type),
-                self,
-                self._template._grpc_client,
-                grpc_face.is_reversed,
+        grpc_faces = self._template._faces_cache.get(self.id)
+        if grpc_faces is None:
+            self._template._grpc_client.log.debug(
+                f"Retrieving faces for body {self.id} from server."
             )
-            for grpc_face in grpc_faces.faces
-        ]
+            grpc_faces = self._template._bodies_stub.GetFaces(EntityIdentifier(id=self.id)).faces
+            self._template._faces_cache[self.id] = grpc_faces
+
+        return _build_faces(grpc_faces, self, self._template._grpc_client)
 
     @property
     @protect_grpc
     @ensure_design_is_active
     def edges(self) -> List[Edge]:  # noqa: D102
-        self._template._grpc_client.log.debug(f"Retrieving edges for body {self.id} from server.")
-        grpc_edges = self._template._bodies_stub.GetEdges(EntityIdentifier(id=self.id))
-        return [
-            Edge(
-                grpc_edge.id,
-                CurveType(grpc_edge.curve_type),
-                self,
-                self._template._grpc_client,
-                grpc_edge.is_reversed,
+        grpc_edges = self._template._edges_cache.get(self.id)
+        if grpc_edges is None:
+            self._template._grpc_client.log.debug(
+                f"Retrieving edges for body {self.id} from server."
             )
-            for grpc_edge in grpc_edges.edges
-        ]
+            grpc_edges = self._template._bodies_stub.GetEdges(EntityIdentifier(id=self.id)).edges
+            self._template._edges_cache[self.id] = grpc_edges
+
+        return _build_edges(grpc_edges, self, self._template._grpc_client)
 
     @property
     def _is_alive(self) -> bool:  # noqa: D102
@@ -1124,11 +1224,11 @@ class Body(IBody):
 
     @property
     def is_surface(self) -> bool:  # noqa: D102
-        return self._template.is_surface
+        return self._template._is_surface
 
     @property
     def _surface_thickness(self) -> Union[Quantity, None]:  # noqa: D102
-        return self._template.surface_thickness
+        return self._template._surface_thickness
 
     @_surface_thickness.setter
     def _surface_thickness(self, value):
@@ -1136,7 +1236,8 @@ class Body(IBody):
 
     @property
     def surface_thickness(self) -> Union[Quantity, None]:  # noqa: D102
-        return self._surface_thickness
+        template = self._template
+        return template._surface_thickness if template._is_surface else None
 
     @property
     def _surface_offset(self) -> Union["MidSurfaceOffsetType", None]:  # noqa: D102
@@ -1148,7 +1249,8 @@ class Body(IBody):
 
     @property
     def surface_offset(self) -> Union["MidSurfaceOffsetType", None]:  # noqa: D102
-        return self._surface_offset
+        template = self._template
+        return template._surface_offset if template._is_surface else None
 
     @property
     @ensure_design_is_active
@@ -1167,21 +1269,18 @@ class Body(IBody):
     def add_midsurface_offset(self, offset: "MidSurfaceOffsetType") -> None:  # noqa: D102
         self._template.add_midsurface_offset(offset)
 
-    @protect_grpc
+    @protect_grpc_reset_caches
     @ensure_design_is_active
     def imprint_curves(
         self, faces: List[Face], sketch: Sketch
     ) -> Tuple[List[Edge], List[Face]]:  # noqa: D102
         # Verify that each of the faces provided are part of this body
-        body_faces = self.faces
-        for provided_face in faces:
-            is_found = False
-            for body_face in body_faces:
-                if provided_face.id == body_face.id:
-                    is_found = True
-                    break
-            if not is_found:
-                raise ValueError(f"Face with ID {provided_face.id} is not part of this body.")
+        body_face_ids = {body_face.id for body_face in self.faces}
+        invalid_ids = [face.id for face in faces if face.id not in body_face_ids]
+        if invalid_ids:
+            if len(invalid_ids) == 1:
+                raise ValueError(f"Face with ID {invalid_ids[0]} is not part of this body.")
+            raise ValueError(f"Faces with IDs {invalid_ids} are not part of this body.")
 
         self._template._grpc_client.log.debug(
             f"Imprinting curves provided on {self.id} "
@@ -1238,8 +1337,8 @@ class Body(IBody):
 
         return projected_faces
 
-    @check_input_types
-    @protect_grpc
+    @check_input_types_on_debug
+    @protect_grpc_reset_caches
     @ensure_design_is_active
     def imprint_projected_curves(
         self,
@@ -1334,10 +1433,9 @@ class Body(IBody):
     def unite(self, other: Union["Body", Iterable["Body"]]) -> None:  # noqa: D102
         self.__generic_boolean_op(other, "unite", "union operation failed")
 
-    @protect_grpc
-    @reset_tessellation_cache
+    @protect_grpc_reset_caches
     @ensure_design_is_active
-    @check_input_types
+    @check_input_types_on_debug
     def __generic_boolean_op(
         self, other: Union["Body", Iterable["Body"]], type_bool_op: str, err_bool_op: str
     ) -> None:
@@ -35,9 +35,7 @@ from ansys.api.geometry.v0.bodies_pb2 import (
     CreateSweepingProfileRequest,
     TranslateRequest,
 )
-from ansys.api.geometry.v0.bodies_pb2_grpc import BodiesStub
 from ansys.api.geometry.v0.commands_pb2 import CreateBeamSegmentsRequest, CreateDesignPointsRequest
-from ansys.api.geometry.v0.commands_pb2_grpc import CommandsStub
 from ansys.api.geometry.v0.components_pb2 import (
     CreateRequest,
     SetPlacementRequest,
@@ -166,8 +164,8 @@ class Component:
         # Initialize the client and stubs needed
         self._grpc_client = grpc_client
         self._component_stub = ComponentsStub(self._grpc_client.channel)
-        self._bodies_stub = BodiesStub(self._grpc_client.channel)
-        self._commands_stub = CommandsStub(self._grpc_client.channel)
+        self._bodies_stub = self._grpc_client.bodies_stub
+        self._commands_stub = self._grpc_client.commands_stub
 
         if preexisting_id:
             self._name = name
@@ -814,11 +812,13 @@ class Component:
         None
         """
         body_ids_found = []
+        bodies_found = []
 
         for body in bodies:
             body_requested = self.search_body(body.id)
             if body_requested:
                 body_ids_found.append(body_requested.id)
+                bodies_found.append(body_requested)
             else:
                 self._grpc_client.log.warning(
                     f"Body with ID {body.id} and name {body.name} is not found in this "
@@ -839,6 +839,10 @@ class Component:
             )
         )
 
+        # The translated bodies have changed on the server: reset their caches
+        for body in bodies_found:
+            body._template._reset_caches()
+
     @protect_grpc
     @check_input_types
     @ensure_design_is_active
@@ -1177,6 +1181,17 @@ class Component:
         # Kill itself
         self._is_alive = False
 
+    @protect_grpc
+    @ensure_design_is_active
+    def _request_tessellation(self) -> None:
+        """Request the tessellation of all bodies in the component and its children."""
+        for body in self._master_component.part.bodies:
+            body._request_tessellation()
+
+        for comp in self._components:
+            if comp.is_alive:
+                comp._request_tessellation()
+
     def tessellate(
         self, merge_component: bool = False, merge_bodies: bool = False
     ) -> Union["PolyData", "MultiBlock"]:
@@ -1231,6 +1246,30 @@ class Component:
           Y Bounds:     -24.991, 24.991
           Z Bounds:     0.000, 20.000
         """
+        # Request all tessellations upfront so that the round-trips overlap
+        self._request_tessellation()
+
+        return self._tessellate(merge_component, merge_bodies)
+
+    def _tessellate(
+        self, merge_component: bool = False, merge_bodies: bool = False
+    ) -> Union["PolyData", "MultiBlock"]:
+        """
+        Tessellate the component once the tessellations of its bodies are requested.
+
+        Parameters
+        ----------
+        merge_component : bool, default: False
+            Whether to merge this component into a single dataset.
+        merge_bodies : bool, default: False
+            Whether to merge each body into a single dataset.
+
+        Returns
+        -------
+        ~pyvista.PolyData, ~pyvista.MultiBlock
+            Merged :class:`pyvista.PolyData` if ``merge_component=True`` or a
+            composite dataset.
+        """
         import pyvista as pv
 
         # Tessellate the bodies in this component
@@ -1243,7 +1282,7 @@ class Component:
         for comp in self._components:
             if not comp.is_alive:
                 continue
-            blocks_list.append(comp.tessellate(merge_bodies=merge_bodies))
+            blocks_list.append(comp._tessellate(merge_bodies=merge_bodies))
 
         # Transform the list of MultiBlock objects into a single MultiBlock
         blocks = pv.MultiBlock(blocks_list)
@@ -27,12 +27,12 @@ from pathlib import Path
 from ansys.api.dbu.v0.dbumodels_pb2 import EntityIdentifier, PartExportFormat
 from ansys.api.dbu.v0.designs_pb2 import NewRequest, SaveAsRequest
 from ansys.api.dbu.v0.designs_pb2_grpc import DesignsStub
+from ansys.api.geometry.v0.bodies_pb2 import SetAssignedMaterialRequest
 from ansys.api.geometry.v0.commands_pb2 import (
     AssignMidSurfaceOffsetTypeRequest,
     AssignMidSurfaceThicknessRequest,
     CreateBeamCircularProfileRequest,
 )
-from ansys.api.geometry.v0.commands_pb2_grpc import CommandsStub
 from ansys.api.geometry.v0.materials_pb2 import AddToDocumentRequest
 from ansys.api.geometry.v0.materials_pb2_grpc import MaterialsStub
 from ansys.api.geometry.v0.models_pb2 import Material as GRPCMaterial
@@ -119,7 +119,7 @@ class Design(Component):
 
         # Initialize the stubs needed
         self._design_stub = DesignsStub(self._grpc_client.channel)
-        self._commands_stub = CommandsStub(self._grpc_client.channel)
+        self._commands_stub = self._grpc_client.commands_stub
         self._materials_stub = MaterialsStub(self._grpc_client.channel)
         self._named_selections_stub = NamedSelectionsStub(self._grpc_client.channel)
         self._parts_stub = PartsStub(self._grpc_client.channel)
@@ -215,6 +215,41 @@ class Design(Component):
 
         self._grpc_client.log.debug(f"Material {material.name} is successfully added to design.")
 
+    @protect_grpc
+    @check_input_types
+    @ensure_design_is_active
+    def assign_material(self, material: Material, bodies: List[Body]) -> None:
+        """
+        Assign a material to a list of bodies.
+
+        Parameters
+        ----------
+        material : Material
+            Source material data.
+        bodies : List[Body]
+            All bodies to assign the material to.
+
+        Notes
+        -----
+        The Geometry service only accepts one body per material assignment request.
+        All requests are sent before waiting for any of them to complete, so that
+        they are pipelined over the channel instead of serialized.
+        """
+        self._grpc_client.log.debug(
+            f"Assigning material {material.name} to bodies {[body.id for body in bodies]}."
+        )
+        # Requests are serialized when sent, so a single message is built and only
+        # its body ID is updated between requests
+        request = SetAssignedMaterialRequest(material=material.name)
+        futures = []
+        for body in bodies:
+            request.id = body._template.id
+            futures.append(self._bodies_stub.SetAssignedMaterial.future(request))
+
+        # Wait for all requests to complete - raises if any of them failed
+        for future in futures:
+            future.result()
+
     @protect_grpc
     @check_input_types
     @ensure_design_is_active
@@ -772,6 +807,15 @@ class Design(Component):
         This method is used to update the design inside repair tools.
         Its usage is not recommended for other purposes.
         """
+        # The bodies already handed out keep their MasterBody objects, whose cached
+        # faces, edges, and tessellation may no longer match the server
+        components = [self]
+        while components:
+            component = components.pop()
+            for body in component._master_component.part.bodies:
+                body._reset_caches()
+            components.extend(component._components)
+
         # Clear all the existing information
         #
         # TODO: This might go out of sync with the __read_existing_design method
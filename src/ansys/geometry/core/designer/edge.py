@@ -24,7 +24,6 @@
 from enum import Enum, unique
 
 from ansys.api.dbu.v0.dbumodels_pb2 import EntityIdentifier
-from ansys.api.geometry.v0.edges_pb2_grpc import EdgesStub
 from beartype.typing import TYPE_CHECKING, List
 from pint import Quantity
 
@@ -74,6 +73,16 @@ class Edge:
         Direction of the edge.
     """
 
+    __slots__ = (
+        "_id",
+        "_curve_type",
+        "_body",
+        "_grpc_client",
+        "_edges_stub",
+        "_is_reversed",
+        "_shape",
+    )
+
     def __init__(
         self,
         id: str,
@@ -87,7 +96,7 @@ class Edge:
         self._curve_type = curve_type
         self._body = body
         self._grpc_client = grpc_client
-        self._edges_stub = EdgesStub(grpc_client.channel)
+        self._edges_stub = grpc_client.edges_stub
         self._is_reversed = is_reversed
         self._shape = None
 
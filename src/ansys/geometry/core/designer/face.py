@@ -24,9 +24,7 @@
 from enum import Enum, unique
 
 from ansys.api.dbu.v0.dbumodels_pb2 import EntityIdentifier
-from ansys.api.geometry.v0.edges_pb2_grpc import EdgesStub
 from ansys.api.geometry.v0.faces_pb2 import CreateIsoParamCurvesRequest
-from ansys.api.geometry.v0.faces_pb2_grpc import FacesStub
 from ansys.api.geometry.v0.models_pb2 import Edge as GRPCEdge
 from beartype.typing import TYPE_CHECKING, List
 from pint import Quantity
@@ -155,6 +153,17 @@ class Face:
         Active supporting Geometry service instance for design modeling.
     """
 
+    __slots__ = (
+        "_id",
+        "_surface_type",
+        "_body",
+        "_grpc_client",
+        "_faces_stub",
+        "_edges_stub",
+        "_is_reversed",
+        "_shape",
+    )
+
     def __init__(
         self,
         id: str,
@@ -168,13 +177,11 @@ class Face:
         self._surface_type = surface_type
         self._body = body
         self._grpc_client = grpc_client
-        self._faces_stub = FacesStub(grpc_client.channel)
-        self._edges_stub = EdgesStub(grpc_client.channel)
+        self._faces_stub = grpc_client.faces_stub
+        self._edges_stub = grpc_client.edges_stub
         self._is_reversed = is_reversed
         self._shape = None
 
-        self._grpc_client.log.debug("Requesting surface properties from server.")
-
     @property
     def id(self) -> str:
         """Face ID."""
@@ -60,7 +60,7 @@ def handler(sig, frame):  # pragma: no cover
     SIGINT_TRACKER.append(True)
 
 
-def protect_grpc(func):
+def protect_grpc(func=None, *, on_exit=None):
     """
     Capture gRPC exceptions and raise a more succinct error message.
 
@@ -69,7 +69,18 @@ def protect_grpc(func):
 
     While this works some of the time, it does not work all of the time. For some
     reason, gRPC still captures SIGINT.
+
+    Parameters
+    ----------
+    func : method, default: None
+        Method to protect. If ``None``, a decorator is returned.
+    on_exit : method, default: None
+        Method called with the first argument of the protected method (usually
+        ``self``) once it returns or raises. This lets other decorators (such as
+        cache resets) share the same wrapper instead of adding extra call frames.
     """
+    if func is None:
+        return lambda func: protect_grpc(func, on_exit=on_exit)
 
     @wraps(func)
     def wrapper(*args, **kwargs):
@@ -101,6 +112,9 @@ def protect_grpc(func):
             raise GeometryExitedError(
                 f"Geometry service connection terminated: {error.details()}"
             ) from None
+        finally:
+            if on_exit is not None:
+                on_exit(args[0])
 
         if threading.current_thread().__class__.__name__ == "_MainThread":
             received_interrupt = bool(SIGINT_TRACKER)
@@ -44,6 +44,9 @@ if TYPE_CHECKING:  # pragma: no cover
 BASE_UNIT_LENGTH = UNITS.get_base_units(DEFAULT_UNITS.LENGTH)[1]
 """Default value for the length of the base unit."""
 
+_BASE_UNITS_CONVERSIONS = {}
+"""Conversion factors and base units of the units already used by ``Point2D._from_values``."""
+
 
 class Point2D(np.ndarray, PhysicalQuantity):
     """
@@ -92,6 +95,28 @@ class Point2D(np.ndarray, PhysicalQuantity):
         self._quantities = [Quantity(elem, units=unit) for elem in input]
         self.flat = [elem.to_base_units().m for elem in self._quantities]
 
+    @classmethod
+    def _from_values(cls, input: np.ndarray, unit: Unit) -> "Point2D":
+        """
+        Create a 2D point from its two values in the given units.
+
+        Notes
+        -----
+        The input is not checked, and the quantities of the components are only
+        built when they are accessed. This method is only meant for internal callers
+        creating many points whose values are valid by construction.
+        """
+        try:
+            factor, base_unit = _BASE_UNITS_CONVERSIONS[unit]
+        except KeyError:
+            factor, base_unit = _BASE_UNITS_CONVERSIONS[unit] = UNITS.get_base_units(unit)
+
+        point = (np.asarray(input, dtype=float) * factor).view(cls)
+        point._unit = unit
+        point._base_unit = base_unit
+        point._quantities = [np.nan, np.nan]
+        return point
+
     @check_input_types
     def __eq__(self, other: "Point2D") -> bool:
         """Equals operator for the ``Point2D`` class."""
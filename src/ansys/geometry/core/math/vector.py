@@ -513,6 +513,20 @@ class UnitVector3D(Vector3D):
         """
         return UnitVector3D(Vector3D.from_points(point_a, point_b))
 
+    @classmethod
+    def _from_unit_array(cls, input: np.ndarray) -> "UnitVector3D":
+        """
+        Create a 3D unit vector from an array that already has a unit norm.
+
+        Notes
+        -----
+        The input is neither checked nor normalized. This method is only meant for
+        internal callers whose vectors are unit vectors by construction.
+        """
+        obj = np.asarray(input, dtype=float).view(cls)
+        obj.setflags(write=False)
+        return obj
+
 
 class UnitVector2D(Vector2D):
     """
@@ -32,6 +32,7 @@ from ansys.geometry.core.misc.auxiliary import (
     get_faces_from_ids,
 )
 from ansys.geometry.core.misc.checks import (
+    check_input_types_on_debug,
     check_is_float_int,
     check_ndarray_is_all_nan,
     check_ndarray_is_float_int,
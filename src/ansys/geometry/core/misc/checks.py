@@ -20,6 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """Provides functions for performing common checks."""
+import os
+
+from beartype import beartype
 from beartype.typing import TYPE_CHECKING, Any, Iterable, Optional, Tuple, Union
 import numpy as np
 from pint import Unit
@@ -28,6 +31,24 @@ import semver
 if TYPE_CHECKING:  # pragma: no cover
     from ansys.geometry.core.designer.design import Design
 
+DEBUG_CHECKS: bool = os.environ.get("PYANSYS_GEOMETRY_DEBUG", "false").lower() == "true"
+"""
+Global flag for enabling the runtime type checks of performance-critical methods.
+
+It is read from the ``PYANSYS_GEOMETRY_DEBUG`` environment variable, which must be set
+to ``true`` before importing the library.
+"""
+
+
+def check_input_types_on_debug(method):
+    """
+    Check the input types of a method only when ``DEBUG_CHECKS`` is enabled.
+
+    Otherwise, the method is returned unchanged so that performance-critical methods
+    (which are called repeatedly) do not pay for the type checks.
+    """
+    return beartype(method) if DEBUG_CHECKS else method
+
 
 def ensure_design_is_active(method):
     """
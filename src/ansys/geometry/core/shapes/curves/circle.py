@@ -21,9 +21,10 @@
 # SOFTWARE.
 """Provides for creating and managing a circle."""
 from functools import cached_property
+import math
 
 from beartype import beartype as check_input_types
-from beartype.typing import Union
+from beartype.typing import Tuple, Union
 import numpy as np
 from pint import Quantity
 
@@ -33,7 +34,13 @@ from ansys.geometry.core.math.point import Point3D
 from ansys.geometry.core.math.vector import UnitVector3D, Vector3D
 from ansys.geometry.core.misc.accuracy import Accuracy
 from ansys.geometry.core.misc.measurements import Distance
-from ansys.geometry.core.shapes.curves.curve import Curve
+from ansys.geometry.core.shapes.curves.curve import (
+    _ON_AXIS_SQUARED_DISTANCE,
+    Curve,
+    _coerce_frame,
+    _cos_sin_columns,
+    _transform_frame,
+)
 from ansys.geometry.core.shapes.curves.curve_evaluation import CurveEvaluation
 from ansys.geometry.core.shapes.parameterization import (
     Interval,
@@ -43,6 +50,11 @@ from ansys.geometry.core.shapes.parameterization import (
 )
 from ansys.geometry.core.typing import Real, RealSequence
 
+_CIRCLE_PARAMETERIZATION = Parameterization(
+    ParamForm.PERIODIC, ParamType.CIRCULAR, Interval(0, 2 * np.pi)
+)
+"""Parameterization shared by all circles, since it does not depend on the circle."""
+
 
 class Circle(Curve):
     """
@@ -69,20 +81,19 @@ class Circle(Curve):
         axis: Union[np.ndarray, RealSequence, UnitVector3D, Vector3D] = UNITVECTOR3D_Z,
     ):
         """Initialize the ``Circle`` class."""
-        self._origin = Point3D(origin) if not isinstance(origin, Point3D) else origin
-
-        self._reference = (
-            UnitVector3D(reference) if not isinstance(reference, UnitVector3D) else reference
+        # The y-direction and the frame array are read on every evaluation, so they
+        # are only computed once
+        self._origin, self._reference, self._dir_y, self._axis, self._frame = _coerce_frame(
+            origin, reference, axis, "Circle"
         )
-        self._axis = UnitVector3D(axis) if not isinstance(axis, UnitVector3D) else axis
-
-        if not self._reference.is_perpendicular_to(self._axis):
-            raise ValueError("Circle reference (dir_x) and axis (dir_z) must be perpendicular.")
 
         self._radius = radius if isinstance(radius, Distance) else Distance(radius)
         if self._radius.value <= 0:
             raise ValueError("Radius must be a real positive value.")
 
+        # Magnitude of the radius (in its own units), used by evaluations to avoid pint arithmetic
+        self._radius_m = self._radius.value.m
+
     @property
     def origin(self) -> Point3D:
         """Origin of the circle."""
@@ -96,17 +107,22 @@ class Circle(Curve):
     @property
     def diameter(self) -> Quantity:
         """Diameter of the circle."""
-        return 2 * self.radius
+        return Quantity(2 * self._radius_m, self._radius.unit)
 
     @property
     def perimeter(self) -> Quantity:
         """Perimeter of the circle."""
-        return 2 * np.pi * self.radius
+        return Quantity(2 * np.pi * self._radius_m, self._radius.unit)
 
     @property
     def area(self) -> Quantity:
         """Area of the circle."""
-        return np.pi * self.radius**2
+        return Quantity(np.pi * self._radius_m**2, self._radius.unit**2)
+
+    @cached_property
+    def curvature(self) -> Real:
+        """Curvature of the circle, which is the same at every parameter."""
+        return 1 / abs(self._radius_m)
 
     @property
     def dir_x(self) -> UnitVector3D:
@@ -116,21 +132,23 @@ class Circle(Curve):
     @property
     def dir_y(self) -> UnitVector3D:
         """Y-direction of the circle."""
-        return self.dir_z.cross(self.dir_x)
+        return self._dir_y
 
     @property
     def dir_z(self) -> UnitVector3D:
         """Z-direction of the circle."""
         return self._axis
 
-    @check_input_types
-    def __eq__(self, other: "Circle") -> bool:
+    def __eq__(self, other: object) -> bool:
         """Equals operator for the ``Circle`` class."""
-        return (
-            self._origin == other._origin
-            and self._radius == other._radius
-            and self._reference == other._reference
-            and self._axis == other._axis
+        if not isinstance(other, Circle):
+            # don't attempt to compare against unrelated types
+            return NotImplemented
+
+        # The radius is compared in base units first, then the origin and directions
+        # through the frame arrays
+        return self._radius._value == other._radius._value and np.array_equal(
+            self._frame, other._frame
         )
 
     def evaluate(self, parameter: Real) -> "CircleEvaluation":
@@ -149,6 +167,32 @@ class Circle(Curve):
         """
         return CircleEvaluation(self, parameter)
 
+    def evaluate_batch(
+        self, parameters: Union[np.ndarray, RealSequence]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate the circle at several parameters at once.
+
+        Parameters
+        ----------
+        parameters : Union[~numpy.ndarray, RealSequence]
+            Parameters to evaluate the circle at.
+
+        Returns
+        -------
+        Tuple[~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray]
+            Positions, tangents, and normals of the evaluations, as ``(N, 3)`` arrays.
+        """
+        cos_sin = _cos_sin_columns(parameters)
+        origin, dir_x, dir_y, _ = self._frame
+
+        # Each output is a single (N, 2) x (2, 3) product, with no per-point temporaries
+        normals = cos_sin @ np.array([dir_x, dir_y])
+        tangents = cos_sin @ np.array([dir_y, -dir_x])
+        positions = cos_sin @ np.array([self._radius_m * dir_x, self._radius_m * dir_y])
+        positions += origin
+        return positions, tangents, normals
+
     def transformed_copy(self, matrix: Matrix44) -> "Circle":
         """
         Create a transformed copy of the circle based on a transformation matrix.
@@ -163,14 +207,13 @@ class Circle(Curve):
         Circle
             New circle that is the transformed copy of the original circle.
         """
-        new_point = self.origin.transform(matrix)
-        new_reference = self._reference.transform(matrix)
-        new_axis = self._axis.transform(matrix)
+        new_point, new_reference, new_axis = _transform_frame(self._frame, matrix)
+        new_point.unit = self._origin.unit
         return Circle(
             new_point,
             self.radius,
-            UnitVector3D(new_reference[0:3]),
-            UnitVector3D(new_axis[0:3]),
+            UnitVector3D(new_reference),
+            UnitVector3D(new_axis),
         )
 
     def mirrored_copy(self) -> "Circle":
@@ -182,7 +225,9 @@ class Circle(Curve):
         Circle
             A new circle that is a mirrored copy of the original circle.
         """
-        return Circle(self.origin, self.radius, -self._reference, -self._axis)
+        reference = UnitVector3D._from_unit_array(-self._frame[1])
+        axis = UnitVector3D._from_unit_array(-self._frame[3])
+        return Circle(self._origin, self.radius, reference, axis)
 
     def project_point(self, point: Point3D) -> "CircleEvaluation":
         """
@@ -198,15 +243,41 @@ class Circle(Curve):
         CircleEvaluation
             Resulting evaluation.
         """
-        origin_to_point = point - self.origin
-        dir_in_plane = UnitVector3D.from_points(
-            Point3D([0, 0, 0]), origin_to_point - ((origin_to_point * self.dir_z) * self.dir_z)
-        )
-        if dir_in_plane.is_zero:
+        origin, dir_x, dir_y, _ = self._frame
+        origin_to_point = np.asarray(point) - origin
+
+        # The in-plane coordinates are enough: the angle does not depend on the
+        # component along the axis nor on the length of the in-plane vector
+        x, y = np.dot(origin_to_point, dir_x), np.dot(origin_to_point, dir_y)
+        if x * x + y * y <= _ON_AXIS_SQUARED_DISTANCE:
             return CircleEvaluation(self, 0)
 
-        t = np.arctan2(self.dir_y.dot(dir_in_plane), self.dir_x.dot(dir_in_plane))
-        return CircleEvaluation(self, t)
+        return CircleEvaluation(self, math.atan2(y, x))
+
+    def project_point_batch(self, points: np.ndarray) -> np.ndarray:
+        """
+        Project several points onto the circle at once.
+
+        Parameters
+        ----------
+        points : ~numpy.ndarray
+            ``(N, 3)`` array with the points to project onto the circle.
+
+        Returns
+        -------
+        ~numpy.ndarray
+            ``(N,)`` array with the parameters of the projected points. Points
+            on the axis of the circle are projected onto the zero parameter.
+        """
+        origin, dir_x, dir_y, _ = self._frame
+        origin_to_points = np.asarray(points, dtype=float) - origin
+
+        # The component along the axis does not change the angle, so there is no need
+        # to remove it beforehand
+        x, y = origin_to_points @ dir_x, origin_to_points @ dir_y
+        parameters = np.arctan2(y, x)
+        parameters[x * x + y * y <= _ON_AXIS_SQUARED_DISTANCE] = 0
+        return parameters
 
     def is_coincident_circle(self, other: "Circle") -> bool:
         """
@@ -222,10 +293,11 @@ class Circle(Curve):
         bool
             ``True`` if this circle is coincident with the other, ``False`` otherwise.
         """
+        # Cheapest checks first: plain floats, then the rows of the frame arrays
         return (
-            Accuracy.length_is_equal(self.radius.m, other.radius.m)
-            and self.origin == other.origin
-            and self.dir_z == other.dir_z
+            Accuracy.length_is_equal(self._radius_m, other._radius_m)
+            and np.array_equal(self._frame[3], other._frame[3])
+            and np.array_equal(self._frame[0], other._frame[0])
         )
 
     def parameterization(self) -> Parameterization:
@@ -241,7 +313,7 @@ class Circle(Curve):
         Parameterization
             Information about how the circle is parameterized.
         """
-        return Parameterization(ParamForm.PERIODIC, ParamType.CIRCULAR, Interval(0, 2 * np.pi))
+        return _CIRCLE_PARAMETERIZATION
 
     def contains_param(self, param: Real) -> bool:  # noqa: D102
         raise NotImplementedError("contains_param() is not implemented.")
@@ -277,6 +349,11 @@ class CircleEvaluation(CurveEvaluation):
         """Parameter that the evaluation is based upon."""
         return self._parameter
 
+    @cached_property
+    def _cos_sin(self) -> Tuple[Real, Real]:
+        """Cosine and sine of the parameter, shared by all evaluation properties."""
+        return math.cos(self._parameter), math.sin(self._parameter)
+
     @cached_property
     def position(self) -> Point3D:
         """
@@ -287,11 +364,11 @@ class CircleEvaluation(CurveEvaluation):
         Point3D
             Point that lies on the circle at this evaluation.
         """
-        return (
-            self.circle.origin
-            + ((self.circle.radius * np.cos(self.parameter)) * self.circle.dir_x).m
-            + ((self.circle.radius * np.sin(self.parameter)) * self.circle.dir_y).m
-        )
+        radius = self.circle._radius_m
+        cos, sin = self._cos_sin
+        _, dir_x, dir_y, _ = self.circle._frame
+        offset = (radius * cos) * dir_x + (radius * sin) * dir_y
+        return self.circle.origin + offset.view(Vector3D)
 
     @cached_property
     def tangent(self) -> UnitVector3D:
@@ -303,9 +380,10 @@ class CircleEvaluation(CurveEvaluation):
         UnitVector3D
             Tangent unit vector to the circle at this evaluation.
         """
-        return (
-            np.cos(self.parameter) * self.circle.dir_y - np.sin(self.parameter) * self.circle.dir_x
-        )
+        # Combination of two orthonormal directions with unit-norm weights
+        cos, sin = self._cos_sin
+        _, dir_x, dir_y, _ = self.circle._frame
+        return UnitVector3D._from_unit_array(cos * dir_y - sin * dir_x)
 
     @cached_property
     def normal(self) -> UnitVector3D:
@@ -317,9 +395,10 @@ class CircleEvaluation(CurveEvaluation):
         UnitVector3D
             Normal unit vector to the circle at this evaluation.
         """
-        return UnitVector3D(
-            np.cos(self.parameter) * self.circle.dir_x + np.sin(self.parameter) * self.circle.dir_y
-        )
+        # Combination of two orthonormal directions with unit-norm weights
+        cos, sin = self._cos_sin
+        _, dir_x, dir_y, _ = self.circle._frame
+        return UnitVector3D._from_unit_array(cos * dir_x + sin * dir_y)
 
     @cached_property
     def first_derivative(self) -> Vector3D:
@@ -335,9 +414,9 @@ class CircleEvaluation(CurveEvaluation):
         Vector3D
             First derivative of the evaluation.
         """
-        return self.circle.radius.m * (
-            np.cos(self.parameter) * self.circle.dir_y - np.sin(self.parameter) * self.circle.dir_x
-        )
+        cos, sin = self._cos_sin
+        _, dir_x, dir_y, _ = self.circle._frame
+        return (self.circle._radius_m * (cos * dir_y - sin * dir_x)).view(Vector3D)
 
     @cached_property
     def second_derivative(self) -> Vector3D:
@@ -349,11 +428,11 @@ class CircleEvaluation(CurveEvaluation):
         Vector3D
             Second derivative of the evaluation.
         """
-        return -self.circle.radius.m * (
-            np.cos(self.parameter) * self.circle.dir_x + np.sin(self.parameter) * self.circle.dir_y
-        )
+        cos, sin = self._cos_sin
+        _, dir_x, dir_y, _ = self.circle._frame
+        return (-self.circle._radius_m * (cos * dir_x + sin * dir_y)).view(Vector3D)
 
-    @cached_property
+    @property
     def curvature(self) -> Real:
         """
         Curvature of the circle.
@@ -363,4 +442,4 @@ class CircleEvaluation(CurveEvaluation):
         Real
             Curvature of the circle.
         """
-        return 1 / np.abs(self.circle.radius.m)
+        return self._circle.curvature
@@ -22,17 +22,106 @@
 """Provides the ``Curve`` class."""
 from abc import ABC, abstractmethod
 
-from beartype.typing import TYPE_CHECKING
+from beartype.typing import TYPE_CHECKING, Tuple, Union
+import numpy as np
 
 from ansys.geometry.core.math.matrix import Matrix44
 from ansys.geometry.core.math.point import Point3D
+from ansys.geometry.core.math.vector import UnitVector3D, Vector3D
+from ansys.geometry.core.misc.accuracy import DOUBLE_ACCURACY, Accuracy
 from ansys.geometry.core.shapes.curves.curve_evaluation import CurveEvaluation
 from ansys.geometry.core.shapes.parameterization import Interval, Parameterization
-from ansys.geometry.core.typing import Real
+from ansys.geometry.core.typing import Real, RealSequence
 
 if TYPE_CHECKING:  # pragma: no cover
     from ansys.geometry.core.shapes.curves.trimmed_curve import TrimmedCurve
 
+_ON_AXIS_SQUARED_DISTANCE: Real = DOUBLE_ACCURACY**2
+"""Squared in-plane distance below which a point is projected onto the zero parameter."""
+
+
+def _coerce_frame(
+    origin: Union[np.ndarray, RealSequence, Point3D],
+    reference: Union[np.ndarray, RealSequence, UnitVector3D, Vector3D],
+    axis: Union[np.ndarray, RealSequence, UnitVector3D, Vector3D],
+    curve_name: str,
+) -> Tuple[Point3D, UnitVector3D, UnitVector3D, UnitVector3D, np.ndarray]:
+    """
+    Build the local frame shared by circles and ellipses.
+
+    The inputs are type-checked by the public initializers calling this function,
+    so only the perpendicularity of the directions is checked here.
+
+    Parameters
+    ----------
+    origin : Union[~numpy.ndarray, RealSequence, Point3D]
+        Origin of the curve.
+    reference : Union[~numpy.ndarray, RealSequence, UnitVector3D, Vector3D]
+        X-axis direction.
+    axis : Union[~numpy.ndarray, RealSequence, UnitVector3D, Vector3D]
+        Z-axis direction.
+    curve_name : str
+        Name of the curve, used in the error message.
+
+    Returns
+    -------
+    Tuple[Point3D, UnitVector3D, UnitVector3D, UnitVector3D, ~numpy.ndarray]
+        Origin, x-direction, y-direction, and z-direction of the curve, followed by
+        a ``(4, 3)`` array with the same four rows.
+    """
+    origin = origin if isinstance(origin, Point3D) else Point3D(origin)
+    reference = reference if isinstance(reference, UnitVector3D) else UnitVector3D(reference)
+    axis = axis if isinstance(axis, UnitVector3D) else UnitVector3D(axis)
+
+    # All the math is done on the rows of a plain array, which avoids the ndarray
+    # subclass machinery of the public types
+    frame = np.empty((4, 3), dtype=float)
+    frame[0], frame[1], frame[3] = origin, reference, axis
+
+    # Unit vectors are never zero, so the dot product is enough to check them
+    if not Accuracy.angle_is_zero(np.dot(frame[1], frame[3])):
+        raise ValueError(f"{curve_name} reference (dir_x) and axis (dir_z) must be perpendicular.")
+
+    dir_y = np.cross(frame[3], frame[1])
+    frame[2] = dir_y / np.linalg.norm(dir_y)
+    return origin, reference, UnitVector3D._from_unit_array(frame[2].copy()), axis, frame
+
+
+def _cos_sin_columns(parameters: Union[np.ndarray, RealSequence]) -> np.ndarray:
+    """Get an ``(N, 2)`` array with the cosines and sines of the given parameters."""
+    parameters = np.asarray(parameters, dtype=float)
+    cos_sin = np.empty((parameters.size, 2))
+    np.cos(parameters, out=cos_sin[:, 0])
+    np.sin(parameters, out=cos_sin[:, 1])
+    return cos_sin
+
+
+def _transform_frame(frame: np.ndarray, matrix: Matrix44) -> Tuple[Point3D, np.ndarray, np.ndarray]:
+    """
+    Apply a transformation matrix to the origin and directions of a curve frame.
+
+    The origin, x-direction, and z-direction are stacked as the columns of a single
+    homogeneous ``(4, 3)`` array, so that one matrix product transforms all of them.
+    Directions are not affected by the translation part of the matrix.
+
+    Parameters
+    ----------
+    frame : ~numpy.ndarray
+        ``(4, 3)`` array with the origin, x-direction, y-direction, and z-direction.
+    matrix : Matrix44
+        4x4 transformation matrix to apply.
+
+    Returns
+    -------
+    Tuple[Point3D, ~numpy.ndarray, ~numpy.ndarray]
+        Transformed origin, x-direction, and z-direction.
+    """
+    homogeneous = np.zeros((4, 3))
+    homogeneous[:3] = frame[[0, 1, 3]].T
+    homogeneous[3, 0] = 1
+    transformed = np.asarray(matrix) @ homogeneous
+    return Point3D(transformed[:3, 0]), transformed[:3, 1], transformed[:3, 2]
+
 
 class Curve(ABC):
     """Provides the abstract base class representing a 3D curve."""
@@ -22,12 +22,13 @@
 """Provides for creating and managing an ellipse."""
 
 from functools import cached_property
+import math
 
 from beartype import beartype as check_input_types
-from beartype.typing import Union
+from beartype.typing import Tuple, Union
 import numpy as np
 from pint import Quantity
-from scipy.integrate import quad
+from scipy.special import ellipe
 
 from ansys.geometry.core.math.constants import UNITVECTOR3D_X, UNITVECTOR3D_Z
 from ansys.geometry.core.math.matrix import Matrix44
@@ -35,7 +36,13 @@ from ansys.geometry.core.math.point import Point3D
 from ansys.geometry.core.math.vector import UnitVector3D, Vector3D
 from ansys.geometry.core.misc.accuracy import Accuracy
 from ansys.geometry.core.misc.measurements import Distance
-from ansys.geometry.core.shapes.curves.curve import Curve
+from ansys.geometry.core.shapes.curves.curve import (
+    _ON_AXIS_SQUARED_DISTANCE,
+    Curve,
+    _coerce_frame,
+    _cos_sin_columns,
+    _transform_frame,
+)
 from ansys.geometry.core.shapes.curves.curve_evaluation import CurveEvaluation
 from ansys.geometry.core.shapes.parameterization import (
     Interval,
@@ -74,17 +81,11 @@ class Ellipse(Curve):
         axis: Union[np.ndarray, RealSequence, UnitVector3D, Vector3D] = UNITVECTOR3D_Z,
     ):
         """Initialize the ``Ellipse`` class."""
-        self._origin = Point3D(origin) if not isinstance(origin, Point3D) else origin
-
-        self._reference = (
-            UnitVector3D(reference) if not isinstance(reference, UnitVector3D) else reference
+        # The y-direction and the frame array are read on every evaluation, so they
+        # are only computed once
+        self._origin, self._reference, self._dir_y, self._axis, self._frame = _coerce_frame(
+            origin, reference, axis, "Ellipse"
         )
-        self._axis = UnitVector3D(axis) if not isinstance(axis, UnitVector3D) else axis
-
-        if not self._reference.is_perpendicular_to(self._axis):
-            raise ValueError(
-                "Ellipse reference (x-direction) and axis (z-direction) must be perpendicular."
-            )
 
         self._major_radius = (
             major_radius if isinstance(major_radius, Distance) else Distance(major_radius)
@@ -93,9 +94,13 @@ class Ellipse(Curve):
             minor_radius if isinstance(minor_radius, Distance) else Distance(minor_radius)
         )
 
-        if self._major_radius.value.m_as(self._major_radius.base_unit) <= 0:
+        # Both radii share the same base unit, so all checks compare these magnitudes
+        major_radius_base = self._major_radius.value.m_as(self._major_radius.base_unit)
+        minor_radius_base = self._minor_radius.value.m_as(self._minor_radius.base_unit)
+
+        if major_radius_base <= 0:
             raise ValueError("Major radius must be a real positive value.")
-        if self._minor_radius.value.m_as(self._minor_radius.base_unit) <= 0:
+        if minor_radius_base <= 0:
             raise ValueError("Minor radius must be a real positive value.")
 
         # Align both units if misaligned
@@ -103,9 +108,13 @@ class Ellipse(Curve):
             self._minor_radius.unit = self._major_radius.unit
 
         # Ensure that the major radius is equal or larger than the minor one
-        if self._major_radius.value.m < self._minor_radius.value.m:
+        if major_radius_base < minor_radius_base:
             raise ValueError("Major radius cannot be shorter than the minor radius.")
 
+        # Magnitudes of the radii (in their own units), used by evaluations to avoid pint arithmetic
+        self._major_radius_m = self._major_radius.value.m
+        self._minor_radius_m = self._minor_radius.value.m
+
     @property
     def origin(self) -> Point3D:
         """Origin of the ellipse."""
@@ -129,22 +138,25 @@ class Ellipse(Curve):
     @property
     def dir_y(self) -> UnitVector3D:
         """Y-direction of the ellipse."""
-        return self.dir_z.cross(self.dir_x)
+        return self._dir_y
 
     @property
     def dir_z(self) -> UnitVector3D:
         """Z-direction of the ellipse."""
         return self._axis
 
-    @check_input_types
-    def __eq__(self, other: "Ellipse") -> bool:
+    def __eq__(self, other: object) -> bool:
         """Equals operator for the ``Ellipse`` class."""
+        if not isinstance(other, Ellipse):
+            # don't attempt to compare against unrelated types
+            return NotImplemented
+
+        # The radii are compared in base units first, then the origin and directions
+        # through the frame arrays
         return (
-            self._origin == other._origin
-            and self._major_radius == other._major_radius
-            and self._minor_radius == other._minor_radius
-            and self._reference == other._reference
-            and self._axis == other._axis
+            self._major_radius._value == other._major_radius._value
+            and self._minor_radius._value == other._minor_radius._value
+            and np.array_equal(self._frame, other._frame)
         )
 
     def mirrored_copy(self) -> "Ellipse":
@@ -156,9 +168,9 @@ class Ellipse(Curve):
         Ellipse
             New ellipse that is a mirrored copy of the original ellipse.
         """
-        return Ellipse(
-            self.origin, self.major_radius, self.minor_radius, -self._reference, -self._axis
-        )
+        reference = UnitVector3D._from_unit_array(-self._frame[1])
+        axis = UnitVector3D._from_unit_array(-self._frame[3])
+        return Ellipse(self._origin, self.major_radius, self.minor_radius, reference, axis)
 
     def evaluate(self, parameter: Real) -> "EllipseEvaluation":
         """
@@ -176,6 +188,34 @@ class Ellipse(Curve):
         """
         return EllipseEvaluation(self, parameter)
 
+    def evaluate_batch(
+        self, parameters: Union[np.ndarray, RealSequence]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate the ellipse at several parameters at once.
+
+        Parameters
+        ----------
+        parameters : Union[~numpy.ndarray, RealSequence]
+            Parameters to evaluate the ellipse at.
+
+        Returns
+        -------
+        Tuple[~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray]
+            Positions, tangents, and normals of the evaluations, as ``(N, 3)`` arrays.
+        """
+        cos_sin = _cos_sin_columns(parameters)
+        origin, dir_x, dir_y, _ = self._frame
+        major_radius, minor_radius = self._major_radius_m, self._minor_radius_m
+
+        # Each output is a single (N, 2) x (2, 3) product, with no per-point temporaries
+        offsets = cos_sin @ np.array([major_radius * dir_x, minor_radius * dir_y])
+        derivatives = cos_sin @ np.array([minor_radius * dir_y, -major_radius * dir_x])
+        positions = offsets + origin
+        tangents = derivatives / np.linalg.norm(derivatives, axis=1)[:, np.newaxis]
+        normals = offsets / np.linalg.norm(offsets, axis=1)[:, np.newaxis]
+        return positions, tangents, normals
+
     def project_point(self, point: Point3D) -> "EllipseEvaluation":
         """
         Project a point onto the ellipse and evaluate the ellipse.
@@ -190,19 +230,43 @@ class Ellipse(Curve):
         EllipseEvaluation
             Resulting evaluation.
         """
-        origin_to_point = point - self.origin
-        dir_in_plane = UnitVector3D.from_points(
-            Point3D([0, 0, 0]), origin_to_point - ((origin_to_point * self.dir_z) * self.dir_z)
-        )
-        if dir_in_plane.is_zero:
+        origin, dir_x, dir_y, _ = self._frame
+        origin_to_point = np.asarray(point) - origin
+
+        # The in-plane coordinates are enough: the angle does not depend on the
+        # component along the axis nor on the length of the in-plane vector
+        x, y = np.dot(origin_to_point, dir_x), np.dot(origin_to_point, dir_y)
+        if x * x + y * y <= _ON_AXIS_SQUARED_DISTANCE:
             return EllipseEvaluation(self, 0)
 
-        t = np.arctan2(
-            self.dir_y.dot(dir_in_plane) * self.major_radius.m,
-            self.dir_x.dot(dir_in_plane) * self.minor_radius.m,
-        )
+        t = math.atan2(y * self._major_radius_m, x * self._minor_radius_m)
         return EllipseEvaluation(self, t)
 
+    def project_point_batch(self, points: np.ndarray) -> np.ndarray:
+        """
+        Project several points onto the ellipse at once.
+
+        Parameters
+        ----------
+        points : ~numpy.ndarray
+            ``(N, 3)`` array with the points to project onto the ellipse.
+
+        Returns
+        -------
+        ~numpy.ndarray
+            ``(N,)`` array with the parameters of the projected points. Points
+            on the axis of the ellipse are projected onto the zero parameter.
+        """
+        origin, dir_x, dir_y, _ = self._frame
+        origin_to_points = np.asarray(points, dtype=float) - origin
+
+        # The component along the axis does not change the angle, so there is no need
+        # to remove it beforehand
+        x, y = origin_to_points @ dir_x, origin_to_points @ dir_y
+        parameters = np.arctan2(y * self._major_radius_m, x * self._minor_radius_m)
+        parameters[x * x + y * y <= _ON_AXIS_SQUARED_DISTANCE] = 0
+        return parameters
+
     def is_coincident_ellipse(self, other: "Ellipse") -> bool:
         """
         Determine if this ellipse is coincident with another.
@@ -217,24 +281,26 @@ class Ellipse(Curve):
         bool
             ``True`` if this ellipse is coincident with the other, ``False`` otherwise.
         """
+        # Cheapest checks first: plain floats, then the rows of the frame arrays
         return (
-            Accuracy.length_is_equal(self.major_radius.m, other.major_radius.m)
-            and Accuracy.length_is_equal(self.minor_radius.m, other.minor_radius.m)
-            and self.origin == other.origin
-            and self.dir_z == other.dir_z
+            Accuracy.length_is_equal(self._major_radius_m, other._major_radius_m)
+            and Accuracy.length_is_equal(self._minor_radius_m, other._minor_radius_m)
+            and np.array_equal(self._frame[3], other._frame[3])
+            and np.array_equal(self._frame[0], other._frame[0])
         )
 
-    @property
+    @cached_property
     def eccentricity(self) -> Real:
         """Eccentricity of the ellipse."""
-        ecc = (self.major_radius.m**2 - self.minor_radius.m**2) ** 0.5 / self.major_radius.m
+        major_radius, minor_radius = self._major_radius_m, self._minor_radius_m
+        ecc = (major_radius**2 - minor_radius**2) ** 0.5 / major_radius
         if ecc == 1:
             raise ValueError("The curve defined is a parabola and not an ellipse.")
         elif ecc > 1:
             raise ValueError("The curve defined is an hyperbola and not an ellipse.")
         return ecc
 
-    @property
+    @cached_property
     def linear_eccentricity(self) -> Quantity:
         """
         Linear eccentricity of the ellipse.
@@ -243,27 +309,33 @@ class Ellipse(Curve):
         -----
         The linear eccentricity is the distance from the center to the focus.
         """
-        return (self.major_radius**2 - self.minor_radius**2) ** 0.5
+        major_radius, minor_radius = self._major_radius_m, self._minor_radius_m
+        return Quantity((major_radius**2 - minor_radius**2) ** 0.5, self._major_radius.unit)
 
-    @property
+    @cached_property
     def semi_latus_rectum(self) -> Quantity:
         """Semi-latus rectum of the ellipse."""
-        return self.minor_radius**2 / self.major_radius
+        major_radius, minor_radius = self._major_radius_m, self._minor_radius_m
+        return Quantity(minor_radius**2 / major_radius, self._major_radius.unit)
 
     @property
     def perimeter(self) -> Quantity:
-        """Perimeter of the ellipse."""
-
-        def integrand(theta, ecc):
-            return np.sqrt(1 - (ecc * np.sin(theta)) ** 2)
+        """
+        Perimeter of the ellipse.
 
-        I, _ = quad(integrand, 0, np.pi / 2, args=(self.eccentricity,))
-        return 4 * self.major_radius * I
+        Notes
+        -----
+        The perimeter is computed through the complete elliptic integral of the
+        second kind, evaluated for the squared eccentricity of the ellipse.
+        """
+        perimeter = 4 * self._major_radius_m * ellipe(self.eccentricity**2)
+        return Quantity(perimeter, self._major_radius.unit)
 
-    @property
+    @cached_property
     def area(self) -> Quantity:
         """Area of the ellipse."""
-        return np.pi * self.major_radius * self.minor_radius
+        area = np.pi * self._major_radius_m * self._minor_radius_m
+        return Quantity(area, self._major_radius.unit**2)
 
     def transformed_copy(self, matrix: Matrix44) -> "Ellipse":
         """
@@ -279,15 +351,14 @@ class Ellipse(Curve):
         Ellipse
             New ellipse that is the transformed copy of the original ellipse.
         """
-        new_point = self.origin.transform(matrix)
-        new_reference = self._reference.transform(matrix)
-        new_axis = self._axis.transform(matrix)
+        new_point, new_reference, new_axis = _transform_frame(self._frame, matrix)
+        new_point.unit = self._origin.unit
         return Ellipse(
             new_point,
             self.major_radius,
             self.minor_radius,
-            UnitVector3D(new_reference[0:3]),
-            UnitVector3D(new_axis[0:3]),
+            UnitVector3D(new_reference),
+            UnitVector3D(new_axis),
         )
 
     def parameterization(self) -> Parameterization:
@@ -338,6 +409,11 @@ class EllipseEvaluation(CurveEvaluation):
         """Parameter that the evaluation is based upon."""
         return self._parameter
 
+    @cached_property
+    def _cos_sin(self) -> Tuple[Real, Real]:
+        """Cosine and sine of the parameter, shared by all evaluation properties."""
+        return math.cos(self._parameter), math.sin(self._parameter)
+
     @cached_property
     def position(self) -> Point3D:
         """
@@ -348,11 +424,12 @@ class EllipseEvaluation(CurveEvaluation):
         Point3D
             Point that lies on the ellipse at this evaluation.
         """
-        return (
-            self.ellipse.origin
-            + ((self.ellipse.major_radius * np.cos(self.parameter)) * self.ellipse.dir_x).m
-            + ((self.ellipse.minor_radius * np.sin(self.parameter)) * self.ellipse.dir_y).m
-        )
+        ellipse = self.ellipse
+        major_radius, minor_radius = ellipse._major_radius_m, ellipse._minor_radius_m
+        cos, sin = self._cos_sin
+        _, dir_x, dir_y, _ = ellipse._frame
+        offset = (major_radius * cos) * dir_x + (minor_radius * sin) * dir_y
+        return ellipse.origin + offset.view(Vector3D)
 
     @cached_property
     def tangent(self) -> UnitVector3D:
@@ -364,10 +441,7 @@ class EllipseEvaluation(CurveEvaluation):
         UnitVector3D
             Tangent unit vector to the ellipse at this evaluation.
         """
-        return (
-            (self.ellipse.minor_radius * np.cos(self.parameter) * self.ellipse.dir_y).m
-            - (self.ellipse.major_radius * np.sin(self.parameter) * self.ellipse.dir_x).m
-        ).normalize()
+        return self.first_derivative.normalize()
 
     @cached_property
     def normal(self) -> UnitVector3D:
@@ -379,7 +453,12 @@ class EllipseEvaluation(CurveEvaluation):
         UnitVector3D
             Normal unit vector to the ellipse at this evaluation.
         """
-        return UnitVector3D.from_points(self.ellipse.origin, self.position)
+        # Direction from the origin to the position, without building the position itself
+        ellipse = self.ellipse
+        major_radius, minor_radius = ellipse._major_radius_m, ellipse._minor_radius_m
+        cos, sin = self._cos_sin
+        _, dir_x, dir_y, _ = ellipse._frame
+        return UnitVector3D((major_radius * cos) * dir_x + (minor_radius * sin) * dir_y)
 
     @cached_property
     def first_derivative(self) -> Vector3D:
@@ -394,9 +473,12 @@ class EllipseEvaluation(CurveEvaluation):
         Vector3D
             First derivative of the evaluation.
         """
-        return (self.ellipse.minor_radius * np.cos(self.parameter) * self.ellipse.dir_y).m - (
-            self.ellipse.major_radius * np.sin(self.parameter) * self.ellipse.dir_x
-        ).m
+        ellipse = self.ellipse
+        major_radius, minor_radius = ellipse._major_radius_m, ellipse._minor_radius_m
+        cos, sin = self._cos_sin
+        _, dir_x, dir_y, _ = ellipse._frame
+        derivative = (minor_radius * cos) * dir_y - (major_radius * sin) * dir_x
+        return derivative.view(Vector3D)
 
     @cached_property
     def second_derivative(self) -> Vector3D:
@@ -408,10 +490,12 @@ class EllipseEvaluation(CurveEvaluation):
         Vector3D
             Second derivative of the evaluation.
         """
-        return (
-            -self.ellipse.major_radius * np.cos(self.parameter) * self.ellipse.dir_x
-            - self.ellipse.minor_radius * np.sin(self.parameter) * self.ellipse.dir_y
-        ).m
+        ellipse = self.ellipse
+        major_radius, minor_radius = ellipse._major_radius_m, ellipse._minor_radius_m
+        cos, sin = self._cos_sin
+        _, dir_x, dir_y, _ = ellipse._frame
+        derivative = (major_radius * cos) * dir_x + (minor_radius * sin) * dir_y
+        return (-derivative).view(Vector3D)
 
     @cached_property
     def curvature(self) -> Real:
@@ -423,4 +507,11 @@ class EllipseEvaluation(CurveEvaluation):
         Real
             Curvature of the ellipse.
         """
-        return self.second_derivative.magnitude / np.power(self.first_derivative.magnitude, 2)
+        # Closed form of |second_derivative| / |first_derivative|^2, which does not need
+        # to build either derivative
+        ellipse = self.ellipse
+        major_radius, minor_radius = ellipse._major_radius_m, ellipse._minor_radius_m
+        cos, sin = self._cos_sin
+        first_derivative_sq = (major_radius * sin) ** 2 + (minor_radius * cos) ** 2
+        second_derivative_sq = (major_radius * cos) ** 2 + (minor_radius * sin) ** 2
+        return math.sqrt(second_derivative_sq) / first_derivative_sq
@@ -317,7 +317,7 @@ class Arc(SketchEdge):
         # k1 = (x_s**2 + y_s**2) - (x_i**2 + y_i**2)
         # k2 = (x_s**2 + y_s**2) - (x_e**2 + y_e**2)
         #
-        # This is easily done with numpy!
+        # Being a 2x2 system, it is solved in closed form (Cramer's rule)
         #
         k11 = 2 * (x_s - x_i)
         k12 = 2 * (y_s - y_i)
@@ -327,7 +327,11 @@ class Arc(SketchEdge):
         k1 = (x_s**2 + y_s**2) - (x_i**2 + y_i**2)
         k2 = (x_s**2 + y_s**2) - (x_e**2 + y_e**2)
 
-        x_c, y_c = np.linalg.solve([[k11, k12], [k21, k22]], [k1, k2])
+        det = k11 * k22 - k12 * k21
+        if det == 0:
+            raise ValueError("The points are collinear, so no arc passes through them.")
+        x_c = (k1 * k22 - k12 * k2) / det
+        y_c = (k11 * k2 - k1 * k21) / det
         center = Point2D([x_c, y_c], unit=DEFAULT_UNITS.LENGTH)
 
         # Now, you should try to figure out if the rotation has to be clockwise or
@@ -21,6 +21,8 @@
 # SOFTWARE.
 """Module for creating and managing gears."""
 
+import math
+
 from beartype import beartype as check_input_types
 from beartype.typing import List, Tuple, Union
 import numpy as np
@@ -35,6 +37,12 @@ from ansys.geometry.core.sketch.face import SketchFace
 from ansys.geometry.core.sketch.segment import SketchSegment
 from ansys.geometry.core.typing import Real
 
+_SINGLE_TOOTH_CACHE_SIZE = 128
+"""Maximum number of single-tooth sketches kept for reuse by spur gears."""
+
+_single_tooth_cache = {}
+"""Single-tooth sketches of spur gears, keyed by module, number of teeth and pressure angle."""
+
 
 class Gear(SketchFace):
     """Provides the base class for sketching gears."""
@@ -42,6 +50,7 @@ class Gear(SketchFace):
     def __init__(self):
         """Initialize the ``Gear`` class."""
         super().__init__()
+        self._visualization_polydata = None
 
     @property
     def visualization_polydata(self) -> pv.PolyData:
@@ -51,12 +60,22 @@ class Gear(SketchFace):
         The representation lies in the X/Y plane within
         the standard global Cartesian coordinate system.
 
+        Notes
+        -----
+        The edges of a gear do not change once it is built, so they are only merged
+        on the first access. A copy is returned because callers may transform it
+        in place.
+
         Returns
         -------
         pyvista.PolyData
             VTK pyvista.Polydata configuration.
         """
-        return pv.merge([edge.visualization_polydata for edge in self._edges])
+        if self._visualization_polydata is None:
+            self._visualization_polydata = pv.merge(
+                [edge.visualization_polydata for edge in self._edges]
+            )
+        return self._visualization_polydata.copy()
 
 
 class DummyGear(Gear):
@@ -95,65 +114,55 @@ class DummyGear(Gear):
             inner_radius if isinstance(inner_radius, Distance) else Distance(inner_radius)
         )
 
+        # Read the magnitudes and units of the radii only once
+        outer_radius_m, outer_unit = outer_radius.value.m, outer_radius.unit
+        inner_radius_m, inner_unit = inner_radius.value.m, inner_radius.unit
+
         # Compute auxiliary variables
         repeat_angle = 2 * np.pi / n_teeth
         tooth_angle = 0.475 * repeat_angle
         gap_angle = repeat_angle - tooth_angle
 
+        # Three angles need to be computed for each tooth: starting tooth angle,
+        # ending tooth angle (==starting gap angle), and ending gap angle
+        start_angles = np.arange(n_teeth) * repeat_angle
+        inter_angles = start_angles + tooth_angle
+        end_angles = inter_angles + gap_angle
+
+        # Compute the sin and cos values for all these angles at once
+        angles = np.array([start_angles, inter_angles, end_angles])
+        cos_sin = np.array([np.cos(angles), np.sin(angles)])
+
+        # Coordinates of the points on the outer and inner circles, indexed
+        # as [x/y, start/inter/end, tooth]
+        outer_xy = outer_radius_m * cos_sin
+        inner_xy = inner_radius_m * cos_sin
+
         # Now, loop over all teeth to build the sketch
+        edges = []
         for tooth_idx in range(n_teeth):
-            # Three angles need to be computed: starting tooth angle,
-            # ending tooth angle (==starting gap angle), and ending gap angle
-            start_ang = tooth_idx * repeat_angle
-            inter_ang = start_ang + tooth_angle
-            end_ang = inter_ang + gap_angle
-
-            # Compute the sin and cos values for these angles
-            sin_inter = np.sin(inter_ang)
-            cos_inter = np.cos(inter_ang)
-            sin_end = np.sin(end_ang)
-            cos_end = np.cos(end_ang)
-
             # Define the points for drawing the arcs and segments involved
-            outer_arc_start = Point2D(
-                [
-                    outer_radius.value.m * np.cos(start_ang),
-                    outer_radius.value.m * np.sin(start_ang),
-                ],
-                unit=outer_radius.unit,
-            )
-            outer_arc_end = Point2D(
-                [outer_radius.value.m * cos_inter, outer_radius.value.m * sin_inter],
-                unit=outer_radius.unit,
-            )
-            inner_arc_start = Point2D(
-                [inner_radius.value.m * cos_inter, inner_radius.value.m * sin_inter],
-                unit=inner_radius.unit,
-            )
-            inner_arc_end = Point2D(
-                [inner_radius.value.m * cos_end, inner_radius.value.m * sin_end],
-                unit=inner_radius.unit,
-            )
-            next_outer_arc_start = Point2D(
-                [outer_radius.value.m * cos_end, outer_radius.value.m * sin_end],
-                unit=outer_radius.unit,
-            )
+            outer_arc_start = Point2D._from_values(outer_xy[:, 0, tooth_idx], outer_unit)
+            outer_arc_end = Point2D._from_values(outer_xy[:, 1, tooth_idx], outer_unit)
+            inner_arc_start = Point2D._from_values(inner_xy[:, 1, tooth_idx], inner_unit)
+            inner_arc_end = Point2D._from_values(inner_xy[:, 2, tooth_idx], inner_unit)
+            next_outer_arc_start = Point2D._from_values(outer_xy[:, 2, tooth_idx], outer_unit)
 
             # Now, proceed to draw the arcs and segments
             # TODO: add plane to SketchSegment when available
-            self._edges.append(
+            edges.append(
                 Arc(center=origin, start=outer_arc_start + origin, end=outer_arc_end + origin)
             )
-            self._edges.append(
-                SketchSegment(start=outer_arc_end + origin, end=inner_arc_start + origin)
-            )
-            self._edges.append(
+            edges.append(SketchSegment(start=outer_arc_end + origin, end=inner_arc_start + origin))
+            edges.append(
                 Arc(center=origin, start=inner_arc_start + origin, end=inner_arc_end + origin)
             )
-            self._edges.append(
+            edges.append(
                 SketchSegment(start=inner_arc_end + origin, end=next_outer_arc_start + origin)
             )
 
+        self._edges.extend(edges)
+
 
 class SpurGear(Gear):
     """
@@ -195,6 +204,9 @@ class SpurGear(Gear):
         self._pressure_angle = pressure_angle.value.to(UNITS.radian)
         self._n_teeth = n_teeth
 
+        # The sketch is computed in millimeters, so keep the origin coordinates at hand
+        self._origin_mm = (origin.x.to(UNITS.mm).m, origin.y.to(UNITS.mm).m)
+
         # Compute additional needed values
         self._ref_diameter = self.module * self.n_teeth
         self._base_diameter = self.ref_diameter * np.cos(self.pressure_angle.m)
@@ -261,53 +273,71 @@ class SpurGear(Gear):
         # Sketch a single tooth first
         tooth_lines = self._sketch_single_tooth_spur_gear()
 
-        # Now, for all teeth, rotate those values
-        rotate_angle = 2 * np.pi / self.n_teeth
-        last_point = None
-        for tooth_idx in range(self.n_teeth):
-            # Rotate the tooth points by a given angle
-            x_i, y_i = self._rotate_curve(tooth_idx * rotate_angle, tooth_lines[0], tooth_lines[2])
-            x_m, y_m = self._rotate_curve(tooth_idx * rotate_angle, tooth_lines[1], tooth_lines[3])
+        # Now, for all teeth, rotate those values at once: each row holds the
+        # points of a tooth rotated by its own angle
+        angles = np.arange(self.n_teeth) * (2 * np.pi / self.n_teeth)
+        x_i_teeth, y_i_teeth = self._rotate_many(angles, tooth_lines[0], tooth_lines[2])
+        x_m_teeth, y_m_teeth = self._rotate_many(angles, tooth_lines[1], tooth_lines[3])
 
+        # Collect all the edges before adding them to the sketch at once
+        edges = []
+        last_point = None
+        for x_i, y_i, x_m, y_m in zip(x_i_teeth, y_i_teeth, x_m_teeth, y_m_teeth):
             if last_point:
                 # Add the closing arc from the previous tooth
-                self._edges.extend(
+                edges.extend(
                     self._generate_arcs(
-                        [last_point[0], x_i[0]], [last_point[1], y_i[0]], closing_involute=True
+                        np.array([last_point[0], x_i[0]]),
+                        np.array([last_point[1], y_i[0]]),
+                        closing_involute=True,
                     )
                 )
 
             # Generate the arcs from involute curve
-            self._edges.extend(self._generate_arcs(x_i, y_i))
+            edges.extend(self._generate_arcs(x_i, y_i))
             # Add the closing involute-to-mirror arc
-            self._edges.extend(
-                self._generate_arcs([x_i[-1], x_m[0]], [y_i[-1], y_m[0]], closing_involute=True)
+            edges.extend(
+                self._generate_arcs(
+                    np.array([x_i[-1], x_m[0]]), np.array([y_i[-1], y_m[0]]), closing_involute=True
+                )
             )
             # Generate the arcs from mirrored involute curve
-            self._edges.extend(self._generate_arcs(x_m, y_m))
+            edges.extend(self._generate_arcs(x_m, y_m))
             # Update the last point value
             last_point = (x_m[-1], y_m[-1])
 
         # When coming out of the loop, close with the starting tooth
-        self._edges.extend(
+        edges.extend(
             self._generate_arcs(
-                [last_point[0], tooth_lines[0][0]],
-                [last_point[1], tooth_lines[2][0]],
+                np.array([last_point[0], tooth_lines[0][0]]),
+                np.array([last_point[1], tooth_lines[2][0]]),
                 closing_involute=True,
             )
         )
 
+        self._edges.extend(edges)
+
     def _sketch_single_tooth_spur_gear(
         self,
-    ) -> Tuple[List[Real], List[Real], List[Real], List[Real]]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
         Sketch a single tooth using this private method.
 
+        Notes
+        -----
+        The tooth only depends on the module, the number of teeth and the pressure
+        angle of the gear, so it is shared between spur gears with the same values.
+        The returned arrays are read-only.
+
         Returns
         -------
-        Tuple[List[Real], List[Real], List[Real], List[Real]]
+        Tuple[~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray]
             X and Y values for the tooth grouped together as follows: (x_i, x_m, y_i, y_m)
         """
+        key = (self.module, self.n_teeth, self.pressure_angle.m)
+        if key in _single_tooth_cache:
+            return _single_tooth_cache[key]
+
         # Compute the involute with the smallest of both
         #
         # FYI: Max angle is slightly less than  90deg
@@ -318,8 +348,8 @@ class SpurGear(Gear):
         x_i, y_i = self._align_involute(x_i, y_i, t_i)
 
         # Get the mirrored section of the involute
-        x_m = list(reversed(x_i))
-        y_m = [-y for y in list(reversed(y_i))]
+        x_m = x_i[::-1]
+        y_m = -y_i[::-1]
 
         # Rotate the mirrored curve by the circular tooth angle
         # First, compute the tooth thickness = circular pitch (== module * pi) / (2 + backlash)
@@ -328,12 +358,19 @@ class SpurGear(Gear):
         circular_tooth_angle = circular_tooth_thickness * 2 / (self.module * self.n_teeth)
         x_m, y_m = self._rotate_curve(circular_tooth_angle, x_m, y_m)
 
-        # Now that you have the whole tooth points, return them
-        return (x_i, x_m, y_i, y_m)
+        # Now that you have the whole tooth points, store them (dropping the oldest
+        # tooth if the cache is full) and return them
+        tooth_lines = (x_i, x_m, y_i, y_m)
+        for values in tooth_lines:
+            values.setflags(write=False)
+        if len(_single_tooth_cache) >= _SINGLE_TOOTH_CACHE_SIZE:
+            del _single_tooth_cache[next(iter(_single_tooth_cache))]
+        _single_tooth_cache[key] = tooth_lines
+        return tooth_lines
 
     def _involute(
         self, radius: Real, max_radius: Real, max_theta: Real, steps: int = 30
-    ) -> Tuple[List[Real], List[Real]]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Generate the involute points discretization of a curve.
 
@@ -350,62 +387,54 @@ class SpurGear(Gear):
 
         Returns
         -------
-        Tuple[List[Real], List[Real], List[Real]]
-            Three-element tuple containing a list of X, Y, and theta values
+        Tuple[~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray]
+            Three-element tuple containing the arrays of X, Y, and theta values
             defining the involute.
         """
-        # Instantiate the containers for storing the results
-        x_p = []
-        y_p = []
-        t_p = []
-
         # Define the delta angle to be increased in each step
         dtheta = max_theta / steps
 
-        # Iterate over the defined steps
-        for i in range(steps):
-            # Compute the involute X, Y and curve angle values
-            c_dtheta = np.cos(i * dtheta)
-            s_dtheta = np.sin(i * dtheta)
-            invol_x = radius * (c_dtheta + i * dtheta * s_dtheta)
-            invol_y = radius * (s_dtheta - i * dtheta * c_dtheta)
-            invol_ang = np.arctan2(invol_y, invol_x)
-            dist = np.sqrt(invol_x**2 + invol_y**2)
-
-            # Append values to result containers
-            x_p.append(invol_x)
-            y_p.append(invol_y)
-            t_p.append(invol_ang)
-
-            # Check if you overcame the max_radius...
-            if dist > max_radius:
-                # You passed the limit... readjust (linear interp to the max)
-                adjustment = (max_radius - radius) / (dist - radius)
-                x_p[-1] = x_p[-2] * (1 - adjustment) + invol_x * adjustment
-                y_p[-1] = y_p[-2] * (1 - adjustment) + invol_y * adjustment
-                t_p[-1] = t_p[-2] * (1 - adjustment) + invol_ang * adjustment
-                break
+        # The involute point at angle theta lies at radius * sqrt(1 + theta**2) from
+        # the center, so the first step beyond the max_radius is known beforehand
+        theta_limit = math.sqrt((max_radius / radius) ** 2 - 1)
+        last_step = min(steps - 1, math.floor(theta_limit / dtheta) + 1)
+
+        # Compute the involute X, Y and curve angle values for all the needed steps
+        theta = np.arange(last_step + 1) * dtheta
+        c_theta = np.cos(theta)
+        s_theta = np.sin(theta)
+        x_p = radius * (c_theta + theta * s_theta)
+        y_p = radius * (s_theta - theta * c_theta)
+        t_p = np.arctan2(y_p, x_p)
+
+        # Check if you overcame the max_radius...
+        dist = radius * math.sqrt(1 + theta[-1] ** 2)
+        if dist > max_radius:
+            # You passed the limit... readjust (linear interp to the max)
+            adjustment = (max_radius - radius) / (dist - radius)
+            for values in (x_p, y_p, t_p):
+                values[-1] = values[-2] * (1 - adjustment) + values[-1] * adjustment
 
         return (x_p, y_p, t_p)
 
     def _align_involute(
-        self, x_p: List[Real], y_p: List[Real], t_p: List[Real]
-    ) -> Tuple[List[Real], List[Real]]:
+        self, x_p: np.ndarray, y_p: np.ndarray, t_p: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Align the discretized values of the involute curve.
 
         Parameters
         ----------
-        x_p : List[Real]
+        x_p : ~numpy.ndarray
             X-elements defining the involute curve to align.
-        y_p : List[Real]
+        y_p : ~numpy.ndarray
             Y-elements defining the involute curve to align.
-        t_p : List[Real]
+        t_p : ~numpy.ndarray
             Angles defining the involute curve to align.
 
         Returns
         -------
-        Tuple[List[Real], List[Real]]
+        Tuple[~numpy.ndarray, ~numpy.ndarray]
             Set of X and Y elements that have been aligned.
 
         Raises
@@ -413,30 +442,28 @@ class SpurGear(Gear):
         ValueError
             If no alignment angle is found.
         """
-        # Compute the angle where the involute curve crosses the circle
-        theta_cross = None
+        # Find the first point beyond the pitch circle. The squared radii of the
+        # involute points are increasing, so a binary search is enough
         pitch_circle_radius = (self.module * self.n_teeth) / 2
-        rr = pitch_circle_radius * pitch_circle_radius
-        for idx in range(0, len(x_p) - 1):
-            rr_2 = x_p[idx + 1] * x_p[idx + 1] + y_p[idx + 1] * y_p[idx + 1]
-            if rr_2 > rr:
-                # This means we passed the angle, adjust!
-                r1 = np.sqrt(x_p[idx] * x_p[idx] + y_p[idx] * y_p[idx])
-                r2 = np.sqrt(rr_2)
-                adjustment = (pitch_circle_radius - r1) / (r2 - r1)
-                theta_cross = t_p[idx] * (1 - adjustment) + t_p[idx + 1] * adjustment
-                break
+        rr = x_p * x_p + y_p * y_p
+        idx = max(np.searchsorted(rr, pitch_circle_radius * pitch_circle_radius, side="right"), 1)
 
         # If no angle is found... fail!
-        if not theta_cross:  # pragma: no cover
+        if idx == len(rr):  # pragma: no cover
             raise ValueError("Error in involute alignment. Check values and implementation.")
 
+        # Compute the angle where the involute curve crosses the circle
+        r1 = math.sqrt(rr[idx - 1])
+        r2 = math.sqrt(rr[idx])
+        adjustment = (pitch_circle_radius - r1) / (r2 - r1)
+        theta_cross = t_p[idx - 1] * (1 - adjustment) + t_p[idx] * adjustment
+
         # Proceed to alignment using -theta_cross
         return self._rotate_curve(-theta_cross, x_p, y_p)
 
     def _rotate_curve(
-        self, angle: Real, x_p: List[Real], y_p: List[Real]
-    ) -> Tuple[List[Real], List[Real]]:
+        self, angle: Real, x_p: np.ndarray, y_p: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Private method used for rotating X,Y elements defining a curve by a given angle.
 
@@ -444,40 +471,57 @@ class SpurGear(Gear):
         ----------
         angle : Real
             Angle (in radians) to rotate the X,Y elements.
-        x_p : List[Real]
+        x_p : ~numpy.ndarray
             X-elements of the curve to rotate.
-        y_p : List[Real]
+        y_p : ~numpy.ndarray
             Y-elements of the curve to rotate.
 
         Returns
         -------
-        Tuple[List[Real], List[Real]]
+        Tuple[~numpy.ndarray, ~numpy.ndarray]
             The X and Y elements of the rotated curve.
         """
-        # Compute the sin and cos values of the angle
-        c_ang = np.cos(angle)
-        s_ang = np.sin(angle)
+        x_r, y_r = self._rotate_many(np.array([angle]), x_p, y_p)
+        return (x_r[0], y_r[0])
+
+    def _rotate_many(
+        self, angles: np.ndarray, x_p: np.ndarray, y_p: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Private method used for rotating X,Y elements defining a curve by several angles.
+
+        Parameters
+        ----------
+        angles : ~numpy.ndarray
+            Angles (in radians) to rotate the X,Y elements.
+        x_p : ~numpy.ndarray
+            X-elements of the curve to rotate.
+        y_p : ~numpy.ndarray
+            Y-elements of the curve to rotate.
 
-        # Rotate the points
-        x_r = []
-        y_r = []
-        for x, y in zip(x_p, y_p):
-            x_r.append(c_ang * x - s_ang * y)
-            y_r.append(s_ang * x + c_ang * y)
+        Returns
+        -------
+        Tuple[~numpy.ndarray, ~numpy.ndarray]
+            The X and Y elements of the rotated curves, with one row per angle.
+        """
+        # Compute the sin and cos values of all angles as columns...
+        c_ang = np.cos(angles)[:, np.newaxis]
+        s_ang = np.sin(angles)[:, np.newaxis]
 
-        return (x_r, y_r)
+        # ...so that all the points are rotated by all the angles at once
+        return (c_ang * x_p - s_ang * y_p, s_ang * x_p + c_ang * y_p)
 
     def _generate_arcs(
-        self, x_p: List[Real], y_p: List[Real], closing_involute: bool = False
+        self, x_p: np.ndarray, y_p: np.ndarray, closing_involute: bool = False
     ) -> List[Arc]:
         """
         Generate the arcs of involute curves when sketching spur gears.
 
         Parameters
         ----------
-        x_p : List[Real]
+        x_p : ~numpy.ndarray
             X-elements defining the involute curve.
-        y_p : List[Real]
+        y_p : ~numpy.ndarray
             Y-elements defining the involute curve.
         closing_involute : bool, optional
             Shortcut for joining involute curves, by default False.
@@ -491,44 +535,47 @@ class SpurGear(Gear):
         arcs = []
 
         # Generate Point2D objects from given X, Y values (remember, they are in mm)
-        points = [
-            Point2D(
-                [x_i + self.origin.x.to(UNITS.mm).m, y_i + self.origin.y.to(UNITS.mm).m],
-                unit=UNITS.mm,
-            )
-            for (x_i, y_i) in zip(x_p, y_p)
-        ]
+        # The origin is added to all the values at once
+        origin_x, origin_y = self._origin_mm
+        x_p, y_p = x_p + origin_x, y_p + origin_y
+        points = [Point2D._from_values(xy, UNITS.mm) for xy in np.column_stack((x_p, y_p))]
 
         if not closing_involute:
-            # Initiate preliminary arc object - lives outside the scope of the loop
-            preliminary_arc = None
-
-            for idx in range(len(points) - 2):
-                # Compute a preliminary arc taking into account three points
-                preliminary_arc = Arc.from_three_points(
-                    start=points[idx], inter=points[idx + 1], end=points[idx + 2]
-                )
-
-                # Keep only the first two points as part of the arc... use the
-                # needed values from the preliminary arc
-                arcs.append(
-                    Arc(
-                        center=preliminary_arc.center,
-                        start=points[idx],
-                        end=points[idx + 1],
-                        clockwise=preliminary_arc.is_clockwise,
+            # The circle through three consecutive points contains both the arc
+            # between the first two points and the arc between the last two, so
+            # only the circles starting at every other point are needed (the last
+            # circle goes through the last three points if a single arc is left)
+            n_points = len(points)
+            arc_starts = range(0, n_points - 1, 2)
+            firsts = np.minimum(arc_starts, n_points - 3)
+            x_0, x_1, x_2 = x_p[firsts], x_p[firsts + 1], x_p[firsts + 2]
+            y_0, y_1, y_2 = y_p[firsts], y_p[firsts + 1], y_p[firsts + 2]
+
+            # Compute the centers of all these circles at once, solving the same
+            # system of equations as Arc.from_three_points does
+            k11, k12 = 2 * (x_0 - x_1), 2 * (y_0 - y_1)
+            k21, k22 = 2 * (x_0 - x_2), 2 * (y_0 - y_2)
+            k1 = (x_0**2 + y_0**2) - (x_1**2 + y_1**2)
+            k2 = (x_0**2 + y_0**2) - (x_2**2 + y_2**2)
+            det = k11 * k22 - k12 * k21
+            x_c = (k1 * k22 - k12 * k2) / det
+            y_c = (k11 * k2 - k1 * k21) / det
+
+            # The points go clockwise around the center when they turn right
+            clockwise = (x_1 - x_0) * (y_2 - y_1) - (y_1 - y_0) * (x_2 - x_1) < 0
+
+            for idx, center_x, center_y, is_clockwise in zip(arc_starts, x_c, y_c, clockwise):
+                # Keep only the pairs of points as part of the arcs
+                center = Point2D._from_values([center_x, center_y], UNITS.mm)
+                for arc_idx in range(idx, min(idx + 2, n_points - 1)):
+                    arcs.append(
+                        Arc(
+                            center=center,
+                            start=points[arc_idx],
+                            end=points[arc_idx + 1],
+                            clockwise=bool(is_clockwise),
+                        )
                     )
-                )
-
-            # Once the loop has finished... extend the last arc
-            arcs.append(
-                Arc(
-                    center=preliminary_arc.center,
-                    start=points[-2],
-                    end=points[-1],
-                    clockwise=preliminary_arc.is_clockwise,
-                )
-            )
 
         else:
             # We should only enter this branch if we are closing the involute curves...
@@ -26,7 +26,7 @@ from ansys.api.geometry.v0.measuretools_pb2 import (
     MinDistanceBetweenObjectsResponse,
 )
 from ansys.api.geometry.v0.measuretools_pb2_grpc import MeasureToolsStub
-from beartype.typing import TYPE_CHECKING
+from beartype.typing import TYPE_CHECKING, List, Tuple
 
 from ansys.geometry.core.connection import GrpcClient
 from ansys.geometry.core.errors import protect_grpc
@@ -109,7 +109,36 @@ class MeasurementTools:
         Gap
             Gap between two bodies.
         """
-        response = self._measure_stub.MinDistanceBetweenObjects(
-            MinDistanceBetweenObjectsRequest(bodies=[body1.id, body2.id])
-        )
-        return Gap._from_distance_response(response)
+        return self.min_distances_between_objects([(body1, body2)])[0]
+
+    @protect_grpc
+    @min_backend_version(24, 2, 0)
+    def min_distances_between_objects(self, pairs: List[Tuple["Body", "Body"]]) -> List[Gap]:
+        """
+        Find the gaps between several pairs of bodies.
+
+        Parameters
+        ----------
+        pairs : List[Tuple[Body, Body]]
+            Pairs of bodies to measure the gaps between.
+
+        Returns
+        -------
+        List[Gap]
+            Gaps between each pair of bodies, in the same order as the pairs.
+
+        Notes
+        -----
+        The Geometry service only accepts one pair of bodies per request.
+        All requests are sent before waiting for any of them to complete, so that
+        they are pipelined over the channel instead of serialized.
+        """
+        futures = [
+            self._measure_stub.MinDistanceBetweenObjects.future(
+                MinDistanceBetweenObjectsRequest(bodies=[body1.id, body2.id])
+            )
+            for body1, body2 in pairs
+        ]
+
+        # Wait for all requests to complete - raises if any of them failed
+        return [Gap._from_distance_response(future.result()) for future in futures]
@@ -135,6 +135,10 @@ def test_design_extrusion_and_material_assignment(modeler: Modeler):
     # Assign a material to a Body
     body.assign_material(material)
 
+    # Assign a material to several bodies at once
+    body_2 = design.extrude_sketch("JustACircle_2", sketch, Quantity(20, UNITS.mm))
+    design.assign_material(material, [body, body_2])
+
     # TODO: Not possible to save to file from a container (CI/CD)
     #       Use download approach when available.
     #
@@ -816,6 +820,35 @@ def test_single_body_translation(modeler: Modeler):
     body_polygon_comp.translate(UnitVector3D([-1, 1, -1]), 101)
 
 
+def test_body_translation_reuses_request(modeler: Modeler):
+    """Test that repeating an identical translation of a ``Body`` reuses its request."""
+    design = modeler.create_design("RepeatedTranslation_Test")
+    sketch = Sketch()
+    sketch.box(Point2D([0, 0], UNITS.mm), Quantity(10, UNITS.mm), Quantity(10, UNITS.mm))
+    body = design.extrude_sketch("Box", sketch, Quantity(10, UNITS.mm))
+
+    body.translate(UnitVector3D([1, 0, 0]), Quantity(5, UNITS.mm))
+    request = body._template._last_translate_request[1]
+
+    # Repeating an identical translation reuses the previous request
+    body.translate(UnitVector3D([1, 0, 0]), Distance(5, UNITS.mm))
+    assert body._template._last_translate_request[1] is request
+
+    # Changing the direction builds a new request
+    body.translate(UnitVector3D([0, 1, 0]), Quantity(5, UNITS.mm))
+    direction_request = body._template._last_translate_request[1]
+    assert direction_request is not request
+    assert direction_request.direction.y == 1
+    assert direction_request.distance == pytest.approx(0.005)
+
+    # Changing the distance builds a new request
+    body.translate(UnitVector3D([0, 1, 0]), Quantity(10, UNITS.mm))
+    distance_request = body._template._last_translate_request[1]
+    assert distance_request is not direction_request
+    assert distance_request.direction.y == 1
+    assert distance_request.distance == pytest.approx(0.01)
+
+
 def test_bodies_translation(modeler: Modeler):
     """
     Test for verifying the correct translation of list of ``Body``.
@@ -48,3 +48,15 @@ def test_min_distance_between_objects(modeler: Modeler):
     design = modeler.open_file("./tests/integration/files/MixingTank.scdocx")
     gap = modeler.measurement_tools.min_distance_between_objects(design.bodies[2], design.bodies[1])
     assert abs(gap.distance._value - 0.0892) <= 0.01
+
+
+def test_min_distances_between_objects(modeler: Modeler):
+    """Test if the gaps between several pairs of bodies are measured in order."""
+    skip_if_linux(modeler)  # Skip test on Linux
+    design = modeler.open_file("./tests/integration/files/MixingTank.scdocx")
+    pairs = [(design.bodies[2], design.bodies[1]), (design.bodies[1], design.bodies[2])]
+    gaps = modeler.measurement_tools.min_distances_between_objects(pairs)
+    assert len(gaps) == 2
+    for gap in gaps:
+        assert abs(gap.distance._value - 0.0892) <= 0.01
+    assert modeler.measurement_tools.min_distances_between_objects([]) == []
@@ -158,6 +158,28 @@ def test_fix_missing_face(modeler: Modeler):
     assert problem_areas[0].fix().success is True
 
 
+def test_fix_resets_body_caches(modeler: Modeler):
+    """Test that fixing a problem area invalidates the cached faces and edges of bodies."""
+    skip_if_linux(modeler)  # Skip test on Linux
+    design = modeler.open_file("./tests/integration/files/MissingFacesDesignBefore.scdocx")
+    body = design.bodies[0]
+
+    # Fill the caches of the body
+    assert body.faces
+    assert body.edges
+    assert body._template._faces_cache
+    assert body._template._edges_cache
+
+    problem_areas = modeler.repair_tools.find_missing_faces(design.bodies)
+    assert problem_areas[0].fix().success is True
+
+    # The caches are emptied, and the body retrieves the new topology from the server
+    assert not body._template._faces_cache
+    assert not body._template._edges_cache
+    assert [face.id for face in body.faces] == [face.id for face in design.bodies[0].faces]
+    assert [edge.id for edge in body.edges] == [edge.id for edge in design.bodies[0].edges]
+
+
 def test_find_duplicate_faces(modeler: Modeler):
     """Test to read geometry and find it's duplicate face problem areas."""
     skip_if_linux(modeler)  # Skip test on Linux
@@ -90,10 +90,25 @@ def test_body_tessellate(modeler: Modeler, skip_not_on_linux_service):
     assert comp_1_instance.bodies[0].tessellate() != comp_1.bodies[0].tessellate()
 
     assert comp_1.bodies[0]._template._tessellation is not None
+    # One dataset per (world transformation, merge) pair has been cached
+    assert len(comp_1.bodies[0]._template._tessellation_datasets) == 3
+
+    # Cached datasets are reused for the same world transformation
+    assert comp_1.bodies[0].tessellate(merge=True) == mesh_1
+    assert len(comp_1.bodies[0]._template._tessellation_datasets) == 3
+
+    # Modifying a returned dataset in place does not alter the cached one
+    blocks = comp_1.bodies[0].tessellate()
+    blocks[0].points[:] *= 2
+    mesh = comp_1.bodies[0].tessellate(merge=True)
+    mesh.points[:] *= 2
+    assert comp_1.bodies[0].tessellate() == blocks_1
+    assert comp_1.bodies[0].tessellate(merge=True) == mesh_1
 
     comp_1.bodies[0].translate(UnitVector3D([1, 0, 0]), 1)
 
     assert comp_1.bodies[0]._template._tessellation is None
+    assert len(comp_1.bodies[0]._template._tessellation_datasets) == 0
 
 
 def test_component_tessellate(modeler: Modeler, skip_not_on_linux_service):
@@ -140,3 +155,12 @@ def test_component_tessellate(modeler: Modeler, skip_not_on_linux_service):
         rel=1e-6,
         abs=1e-8,
     )
+
+    # Tessellating the design requests the tessellation of the nested bodies
+    # upfront and consumes all of these requests
+    for body in comp.bodies:
+        body._template._reset_caches()
+    blocks = design.tessellate()
+    assert blocks.n_blocks == 2
+    assert all(body._template._tessellation_future is None for body in comp.bodies)
+    assert all(body._template._tessellation is not None for body in comp.bodies)
@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from ansys.api.geometry.v0.models_pb2 import Tessellation
 from beartype.roar import BeartypeCallHintParamViolation
 import grpc
 import numpy as np
@@ -37,6 +38,7 @@ from ansys.geometry.core.connection.conversions import (
     sketch_ellipse_to_grpc_ellipse,
     sketch_polygon_to_grpc_polygon,
     sketch_segment_to_grpc_line,
+    tess_to_pd,
     unit_vector_to_grpc_direction,
 )
 from ansys.geometry.core.math import Frame, Plane, Point2D, Point3D, UnitVector3D
@@ -298,3 +300,15 @@ def test_frame_message_conversion():
     assert grpc_frame_message.dir_y.x == pytest.approx(0.7071067811865475, rel=1e-7, abs=1e-8)
     assert grpc_frame_message.dir_y.y == pytest.approx(-0.7071067811865475, rel=1e-7, abs=1e-8)
     assert grpc_frame_message.dir_y.z == 0.0
+
+
+def test_tessellation_message_conversion():
+    """Test conversion between a tessellation gRPC message and a ``pyvista.PolyData``."""
+    vertices = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0]
+    faces = [3, 0, 1, 2, 3, 0, 2, 3]
+    pdata = tess_to_pd(Tessellation(vertices=vertices, faces=faces))
+
+    assert pdata.n_points == 4
+    assert pdata.n_cells == 2
+    assert np.array_equal(pdata.points, np.reshape(vertices, (-1, 3)))
+    assert np.array_equal(pdata.faces, faces)
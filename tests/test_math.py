@@ -228,6 +228,14 @@ def test_point2d_units():
     assert not raw_y == p_cm_to_mm[1]
     assert raw_y == p_cm_to_mm[1] * 20
 
+    # The internal fast path yields the same point as the public constructor
+    p_fast = Point2D._from_values(np.array([10, 20]), UNITS.cm)
+    assert p_fast == Point2D([10, 20], UNITS.cm)
+    assert p_fast.unit == UNITS.cm
+    assert p_fast.base_unit == UNITS.m
+    assert p_fast.x == 10 * UNITS.cm
+    assert p_fast.y == 20 * UNITS.cm
+
 
 def test_point3d_units():
     """``Point3D`` units testing."""
@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from beartype.roar import BeartypeCallHintParamViolation
 import numpy as np
 import pytest
 
@@ -27,6 +28,7 @@ from ansys.geometry.core.errors import GeometryRuntimeError
 from ansys.geometry.core.math import Point3D
 from ansys.geometry.core.misc import (
     UNITS,
+    check_input_types_on_debug,
     check_is_float_int,
     check_ndarray_is_float_int,
     check_ndarray_is_non_zero,
@@ -252,3 +254,23 @@ def test_min_version_backend():
         match="The client is not available. You must initialize the client first.",
     ):
         case_no_client(mock_object)
+
+
+def test_check_input_types_on_debug(monkeypatch):
+    """Test that the type checks are only applied when debugging."""
+    import ansys.geometry.core.misc.checks as checks
+
+    def add_one(value: int) -> int:
+        return value + 1
+
+    # By default, the method is returned untouched
+    monkeypatch.setattr(checks, "DEBUG_CHECKS", False)
+    assert check_input_types_on_debug(add_one) is add_one
+    assert check_input_types_on_debug(add_one)(1.5) == 2.5
+
+    # When debugging, the input types are checked
+    monkeypatch.setattr(checks, "DEBUG_CHECKS", True)
+    checked_add_one = check_input_types_on_debug(add_one)
+    assert checked_add_one(1) == 2
+    with pytest.raises(BeartypeCallHintParamViolation):
+        checked_add_one(1.5)
@@ -695,6 +695,7 @@ def test_circle():
     assert origin_circle.origin.y == origin.y
     assert origin_circle.origin.z == origin.z
     assert origin_circle.radius.m == 10
+    assert origin_circle._radius_m == 10
     assert origin_circle.dir_x == UNITVECTOR3D_X
     assert origin_circle.dir_y == UNITVECTOR3D_Y
     assert origin_circle.dir_z == UNITVECTOR3D_Z
@@ -704,6 +705,17 @@ def test_circle():
     assert origin_circle == origin_duplicate_circle
     assert origin_circle.is_coincident_circle(origin_duplicate_circle)
     assert origin_circle != bigger_circle
+    assert origin_circle != tilted_circle
+    assert origin_circle != "circle"
+    assert not origin_circle.is_coincident_circle(bigger_circle)
+    assert not origin_circle.is_coincident_circle(tilted_circle)
+
+    # Test transformations, where directions are not affected by translations
+    matrix = Matrix44([[0, -1, 0, 1], [1, 0, 0, 2], [0, 0, 1, 3], [0, 0, 0, 1]])
+    circle_transformation = origin_circle.transformed_copy(matrix)
+    assert np.allclose(circle_transformation.origin, Point3D([1, 2, 3]))
+    assert np.allclose(circle_transformation.dir_x, UNITVECTOR3D_Y)
+    assert np.allclose(circle_transformation.dir_z, UNITVECTOR3D_Z)
 
     # Test expected errors
     with pytest.raises(ValueError):
@@ -750,6 +762,8 @@ def test_circle_evaluation():
     assert eval.first_derivative == UNITVECTOR3D_Y
     assert eval.second_derivative == UnitVector3D([-1, 0, 0])
     assert eval.curvature == 1
+    assert circle.curvature == 1
+    assert circle.parameterization() is circle.parameterization()
 
     # Test evaluation at (.785) by projecting a point
     eval2 = circle.project_point(Point3D([1, 1, 0]))
@@ -761,6 +775,27 @@ def test_circle_evaluation():
     assert np.allclose(eval2.second_derivative, UnitVector3D([-np.sqrt(2) / 2, -np.sqrt(2) / 2, 0]))
     assert eval2.curvature == 1
 
+    # Points on the axis of the circle are projected onto the zero parameter
+    assert circle.project_point(Point3D([0, 0, 5])).parameter == 0
+
+    # Test batch projection against single projections
+    points = np.array([[1, 1, 0], [3, 3, 0], [-2, 1, 4], [0, 0, 5]])
+    params = circle.project_point_batch(points)
+    assert params.shape == (4,)
+    for point, param in zip(points, params):
+        assert np.isclose(param, circle.project_point(Point3D(point)).parameter)
+
+    # Test batch evaluation against single evaluations
+    tilted_circle = Circle(Point3D([1, 2, 3]), Distance(2), [1, 1, 0], [0, 0, 1])
+    params = np.linspace(0, 2 * np.pi, 7)
+    positions, tangents, normals = tilted_circle.evaluate_batch(params)
+    assert positions.shape == tangents.shape == normals.shape == (7, 3)
+    for param, position, tangent, normal in zip(params, positions, tangents, normals):
+        eval = tilted_circle.evaluate(param)
+        assert np.allclose(position, eval.position)
+        assert np.allclose(tangent, eval.tangent)
+        assert np.allclose(normal, eval.normal)
+
 
 def test_line():
     """``Line`` construction and equivalency."""
@@ -850,6 +885,8 @@ def test_ellipse():
     assert origin_ellipse.origin.z == origin.z
     assert origin_ellipse.major_radius.m == 10
     assert origin_ellipse.minor_radius.m == 5
+    assert origin_ellipse._major_radius_m == 10
+    assert origin_ellipse._minor_radius_m == 5
     assert origin_ellipse.dir_x == UNITVECTOR3D_X
     assert origin_ellipse.dir_y == UNITVECTOR3D_Y
     assert origin_ellipse.dir_z == UNITVECTOR3D_Z
@@ -859,6 +896,17 @@ def test_ellipse():
     assert origin_ellipse == origin_duplicate_ellipse
     assert origin_ellipse.is_coincident_ellipse(origin_duplicate_ellipse)
     assert origin_ellipse != bigger_ellipse
+    assert origin_ellipse != tilted_ellipse
+    assert origin_ellipse != "ellipse"
+    assert not origin_ellipse.is_coincident_ellipse(bigger_ellipse)
+    assert not origin_ellipse.is_coincident_ellipse(tilted_ellipse)
+
+    # Test transformations, where directions are not affected by translations
+    matrix = Matrix44([[0, -1, 0, 1], [1, 0, 0, 2], [0, 0, 1, 3], [0, 0, 0, 1]])
+    ellipse_transformation = origin_ellipse.transformed_copy(matrix)
+    assert np.allclose(ellipse_transformation.origin, Point3D([1, 2, 3]))
+    assert np.allclose(ellipse_transformation.dir_x, UNITVECTOR3D_Y)
+    assert np.allclose(ellipse_transformation.dir_z, UNITVECTOR3D_Z)
 
     # Test expected errors
     with pytest.raises(ValueError):
@@ -930,3 +978,24 @@ def test_ellipse_evaluation():
     )
 
     assert Accuracy.length_is_equal(eval2.curvature, 0.31540327)
+
+    # Points on the axis of the ellipse are projected onto the zero parameter
+    assert ellipse.project_point(Point3D([0, 0, 5])).parameter == 0
+
+    # Test batch projection against single projections
+    points = np.array([[1, 1, 0], [3, 3, 0], [-2, 1, 4], [0, 0, 5]])
+    params = ellipse.project_point_batch(points)
+    assert params.shape == (4,)
+    for point, param in zip(points, params):
+        assert np.isclose(param, ellipse.project_point(Point3D(point)).parameter)
+
+    # Test batch evaluation against single evaluations
+    tilted_ellipse = Ellipse(Point3D([1, 2, 3]), Distance(3), Distance(2), [1, 1, 0], [0, 0, 1])
+    params = np.linspace(0, 2 * np.pi, 7)
+    positions, tangents, normals = tilted_ellipse.evaluate_batch(params)
+    assert positions.shape == tangents.shape == normals.shape == (7, 3)
+    for param, position, tangent, normal in zip(params, positions, tangents, normals):
+        eval = tilted_ellipse.evaluate(param)
+        assert np.allclose(position, eval.position)
+        assert np.allclose(tangent, eval.tangent)
+        assert np.allclose(normal, eval.normal)
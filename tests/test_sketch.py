@@ -776,6 +776,13 @@ def test_arc_from_three_points():
         if point[1] > 0:
             assert point[0] < 0 or np.isclose(point[0], 0)
 
+    # Case 3: the center is the origin
+    assert arc.center == Point2D([0, 0])
+
+    # Case 4: collinear points do not define an arc
+    with pytest.raises(ValueError, match="The points are collinear"):
+        Arc.from_three_points(start, Point2D([2.5, 2.5]), end)
+
 
 def test_polydata_methods():
     sketch = Sketch()